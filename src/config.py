@@ -3,7 +3,7 @@ import fnmatch
 import warnings
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 import yaml
 
@@ -633,7 +633,39 @@ def _merge_dict(base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
             merged[key] = value
     return merged
 
-def get_pdf_settings(input_path: Path, file_type: str, base_path: Optional[Path] = None) -> PDFConversionSettings:
+def compute_match_paths(
+    input_path: Optional[Path], base_path: Optional[Path] = None
+) -> Tuple[str, str]:
+    """
+    Compute the path strings used for rule pattern matching.
+
+    Resolving paths touches the filesystem, so batch callers compute this once
+    per file and pass it to every settings lookup for that file.
+
+    Returns:
+        Tuple of (posix path string, posix path relative to base_path). The
+        relative string is empty when input_path is not under base_path.
+    """
+    path_str = input_path.as_posix() if input_path else ""
+    rel_path_str = ""
+    if input_path and base_path:
+        try:
+            # Ensure both are absolute for reliable relative_to
+            abs_input = input_path.resolve()
+            abs_base = base_path.resolve()
+            rel_path_str = abs_input.relative_to(abs_base).as_posix()
+        except ValueError:
+            # Not under base_path
+            rel_path_str = ""
+    return path_str, rel_path_str
+
+
+def get_pdf_settings(
+    input_path: Path,
+    file_type: str,
+    base_path: Optional[Path] = None,
+    match_paths: Optional[Tuple[str, str]] = None,
+) -> PDFConversionSettings:
     """
     Get PDF settings by applying Pattern-Priority rules.
     
@@ -650,6 +682,7 @@ def get_pdf_settings(input_path: Path, file_type: str, base_path: Optional[Path]
         input_path: The file path to check against rule patterns.
         file_type: The type of document ("word", "excel", "powerpoint").
         base_path: Optional root directory to calculate relative paths for matching.
+        match_paths: Optional result of ``compute_match_paths`` for this file.
     """
     config = load_config()
     pdf_section = config.get("pdf_settings", {})
@@ -661,18 +694,7 @@ def get_pdf_settings(input_path: Path, file_type: str, base_path: Optional[Path]
          return PDFConversionSettings()
 
     # Determine paths for matching
-    path_str = input_path.as_posix() if input_path else ""
-    rel_path_str = ""
-    if input_path and base_path:
-        try:
-            # Ensure both are absolute for reliable relative_to
-            abs_input = input_path.resolve()
-            abs_base = base_path.resolve()
-            rel_path = abs_input.relative_to(abs_base)
-            rel_path_str = rel_path.as_posix()
-        except ValueError:
-            # Not under base_path
-            rel_path_str = ""
+    path_str, rel_path_str = match_paths or compute_match_paths(input_path, base_path)
     
     # Filter matching rules
     matching_rules = []
@@ -719,7 +741,20 @@ def get_pdf_settings(input_path: Path, file_type: str, base_path: Optional[Path]
     return PDFConversionSettings.from_dict(final_settings_dict)
 
 
-def get_excel_sheet_settings(sheet_name: str, base_settings: Optional[PDFConversionSettings] = None, input_path: Optional[Path] = None, base_path: Optional[Path] = None) -> PDFConversionSettings:
+def load_excel_sheet_rules() -> Any:
+    """Return the raw ``pdf_settings.excel`` rule list from the configuration."""
+    return load_config().get("pdf_settings", {}).get("excel", [])
+
+
+def get_excel_sheet_settings(
+    sheet_name: str,
+    base_settings: Optional[PDFConversionSettings] = None,
+    input_path: Optional[Path] = None,
+    base_path: Optional[Path] = None,
+    match_paths: Optional[Tuple[str, str]] = None,
+    rules: Any = None,
+    cache: Optional[Dict[Tuple[int, ...], PDFConversionSettings]] = None,
+) -> PDFConversionSettings:
     """
     Get Excel PDF settings by applying sheet_name-based Pattern-Priority rules.
     
@@ -735,14 +770,18 @@ def get_excel_sheet_settings(sheet_name: str, base_settings: Optional[PDFConvers
         base_settings: Optional base settings to merge into.
         input_path: Optional file path to check against rule patterns.
         base_path: Optional root directory to calculate relative paths for matching.
+        match_paths: Optional result of ``compute_match_paths`` for input_path,
+            so per-sheet lookups do not resolve the same paths again.
+        rules: Optional result of ``load_excel_sheet_rules``, so per-sheet
+            lookups do not re-read the configuration file.
+        cache: Optional dict shared by lookups with the same base_settings and
+            input_path; sheets matching the same rules reuse one merged result.
     
     Returns:
         PDFConversionSettings with merged sheet-specific settings.
     """
-    config = load_config()
-    pdf_section = config.get("pdf_settings", {})
-    
-    rules = pdf_section.get("excel", [])
+    if rules is None:
+        rules = load_excel_sheet_rules()
     if not isinstance(rules, list):
         return base_settings or PDFConversionSettings()
 
@@ -750,18 +789,9 @@ def get_excel_sheet_settings(sheet_name: str, base_settings: Optional[PDFConvers
     matching_rules = []
     
     # Determine path details for matching
-    path_str = input_path.as_posix() if input_path else ""
-    rel_path_str = ""
-    if input_path and base_path:
-        try:
-            abs_input = input_path.resolve()
-            abs_base = base_path.resolve()
-            rel_path = abs_input.relative_to(abs_base)
-            rel_path_str = rel_path.as_posix()
-        except ValueError:
-            rel_path_str = ""
+    path_str, rel_path_str = match_paths or compute_match_paths(input_path, base_path)
 
-    for rule in rules:
+    for index, rule in enumerate(rules):
         # Check Sheet Name Pattern
         sheet_pattern = rule.get("sheet_name", "*") 
         
@@ -791,10 +821,13 @@ def get_excel_sheet_settings(sheet_name: str, base_settings: Optional[PDFConvers
                  file_match = False
 
         if sheet_match and file_match:
-            matching_rules.append(rule)
+            matching_rules.append((index, rule))
     
     # Sort by priority ascending (higher priority overrides)
-    matching_rules.sort(key=lambda x: x.get("priority", 0))
+    matching_rules.sort(key=lambda item: item[1].get("priority", 0))
+    cache_key = tuple(index for index, _ in matching_rules)
+    if cache is not None and cache_key in cache:
+        return cache[cache_key]
     
     # Start with base settings dict or empty
     if base_settings:
@@ -814,8 +847,11 @@ def get_excel_sheet_settings(sheet_name: str, base_settings: Optional[PDFConvers
         final_settings_dict = {}
     
     # Merge matching rules
-    for rule in matching_rules:
+    for _, rule in matching_rules:
         rule_settings = rule.get("settings", {})
         final_settings_dict = _merge_dict(final_settings_dict, rule_settings)
         
-    return PDFConversionSettings.from_dict(final_settings_dict)
+    merged = PDFConversionSettings.from_dict(final_settings_dict)
+    if cache is not None:
+        cache[cache_key] = merged
+    return merged
@@ -46,7 +46,9 @@ class PrintableContentResolver:
             result.append(WorkbookSheetInfo(index, name, kind, visible))
         return tuple(result)
 
-    def resolve(self, sheet: Any, policy: str, strict: bool = False) -> ContentInventory:
+    def resolve(
+        self, sheet: Any, policy: str, strict: bool = False, used_range: Any = None,
+    ) -> ContentInventory:
         """Document this Excel pipeline operation and its side effects."""
         errors: List[str] = []
         objects = self._objects(sheet, errors)
@@ -72,7 +74,7 @@ class PrintableContentResolver:
                     return ContentInventory((), tuple(objects), tuple(errors))
         if not regions:
             try:
-                used = sheet.UsedRange
+                used = used_range if used_range is not None else sheet.UsedRange
                 first_row, first_col, last_row, last_col = _range_bounds(used)
                 regions.append(ResolvedRegion(
                     0, first_row, first_col, last_row, last_col,
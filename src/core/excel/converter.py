@@ -7,6 +7,8 @@ Features:
 - Configurable row dimensions for vertical pagination
 - Metadata headers (sheet name, row range, filename)
 """
+from __future__ import annotations
+
 import math
 import os
 import tempfile
@@ -14,16 +16,18 @@ import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 import win32com.client
+import win32event
 import win32print
 import pythoncom
+import pywintypes
 import win32process
 import dataclasses
 from contextlib import contextmanager
 
 from ..base import Converter
 from ...config import (
-    PDFConversionSettings, ExcelSettings, get_excel_sheet_settings,
-    get_reporting_config,
+    PDFConversionSettings, ExcelSettings, compute_match_paths,
+    get_excel_sheet_settings, get_reporting_config, load_excel_sheet_rules,
 )
 from ...utils.logger import logger
 from ...utils.process_manager import ProcessRegistry
@@ -43,6 +47,8 @@ from .pdf_quality import PdfQualityExpectation, PdfQualityPostflight
 xlTypePDF = 0
 xlQualityStandard = 0
 xlQualityMinimum = 1
+# optimization.image_quality -> ExportAsFixedFormat Quality; unknown values use standard
+_EXPORT_QUALITY = {"low": xlQualityMinimum}
 xlLandscape = 2
 xlPortrait = 1
 xlPaperLetter = 1
@@ -58,9 +64,19 @@ xlPaperC = 24  # 17x22 in (Arch C)
 xlPaperD = 25  # 22x34 in (Arch D)
 xlPaperE = 26  # 34x44 in (Arch E)
 
+# Serialises gen_py generation across concurrently spawned Excel jobs.
+_GENCACHE_MUTEX_NAME = "Local\\doc2pdf-excel-gencache"
+_GENCACHE_WAIT_MS = 60_000
+
 # Worksheet visibility
 xlSheetVisible = -1
 
+# Interior.ColorIndex / Borders.LineStyle value for "no fill" / "no border"
+xlNone = -4142
+
+# Application.Calculation
+xlCalculationManual = -4135
+
 # AutomationSecurity constants (msoAutomationSecurity)
 msoAutomationSecurityForceDisable = 3
 
@@ -73,6 +89,22 @@ DC_PAPERS = 2
 DC_PAPERSIZE = 3
 DC_PAPERNAMES = 16
 
+# Excel's last column is XFD (16384).
+XL_MAX_COLUMNS = 16384
+
+
+def _column_letters(n: int) -> str:
+    """Convert a 1-based column number to its Excel letters (e.g. 27 -> AA)."""
+    string = ""
+    while n > 0:
+        n, remainder = divmod(n - 1, 26)
+        string = chr(65 + remainder) + string
+    return string
+
+
+# PrintArea strings are built for every region, so letters are looked up.
+_COL_LETTERS = tuple(_column_letters(n) for n in range(1, XL_MAX_COLUMNS + 1))
+
 
 class OversizedSheetError(Exception):
     """Raised when a sheet is too large to print at acceptable quality."""
@@ -250,7 +282,8 @@ class ExcelConverter(Converter):
                 )
             with self._excel_application() as excel:
                 workbook = None
-                temp_sheets_to_delete = []
+                export_workbook = None
+                previous_calculation = None
                 final_sheets_to_process = []
                 
                 try:
@@ -286,6 +319,9 @@ class ExcelConverter(Converter):
                         Local=True,
                         CorruptLoad=xlNormalLoad
                     )
+                    # Values were calculated on open; label inserts, sheet copies
+                    # and PageSetup writes must not trigger further recalculation.
+                    previous_calculation = self._suspend_calculation(excel)
                     
                     # Get sheets to process
                     sheets_to_export = self._get_sheets_to_export(workbook, excel_settings)
@@ -298,25 +334,36 @@ class ExcelConverter(Converter):
                     total_sheets = len(sheets_to_export)
                     sheet_weight = 1.0 / total_sheets if total_sheets > 0 else 0
                     
+                    # Rule inputs are identical for every sheet of this file.
+                    match_paths = compute_match_paths(input_file, base_path)
+                    sheet_rules = load_excel_sheet_rules()
+                    sheet_settings_cache: Dict[Tuple[int, ...], PDFConversionSettings] = {}
+
                     # Apply optional workbook mutations before final region measurement.
                     skipped_sheets = []  # Track skipped oversized sheets
                     expected_page_count = 0
                     exact_page_count = True
                     for sheet in sheets_to_export:
+                        # Name is read once; every use below would otherwise be a COM call.
+                        sheet_name = sheet.Name
                         sheet_output_start = len(final_sheets_to_process)
                         sheet_expected_page_count = expected_page_count
                         sheet_exact_page_count = exact_page_count
                         try:
                             # Get sheet-specific settings
                             # Note: Arguments are (sheet_name, base_settings, input_path, base_path)
-                            sheet_settings = get_excel_sheet_settings(sheet.Name, settings, input_file, base_path)
+                            sheet_settings = get_excel_sheet_settings(
+                                sheet_name, settings, input_file, base_path,
+                                match_paths=match_paths, rules=sheet_rules,
+                                cache=sheet_settings_cache,
+                            )
                             sheet_excel_settings = sheet_settings.excel or excel_settings
                             
-                            logger.debug(f"Sheet '{sheet.Name}' settings: row_dimensions={sheet_excel_settings.row_dimensions}")
+                            logger.debug(f"Sheet '{sheet_name}' settings: row_dimensions={sheet_excel_settings.row_dimensions}")
                             
                             # Insert OCR sheet name label if enabled
                             if sheet_excel_settings.ocr_sheet_name_label:
-                                self._insert_sheet_name_label(sheet, sheet.Name)
+                                self._insert_sheet_name_label(sheet, sheet_name)
                             
                             # Path/label mutations must happen before final measurement.
                             if sheet_excel_settings.is_write_file_path:
@@ -331,10 +378,17 @@ class ExcelConverter(Converter):
                                 sheet, sheet_excel_settings.print_area_policy
                             )
                             if not regions:
-                                skipped_sheets.append(sheet.Name)
+                                skipped_sheets.append(sheet_name)
                                 if on_progress:
                                     on_progress(sheet_weight)
                                 continue
+                            if sheet_excel_settings.metadata_header:
+                                # Chunk copies inherit PageSetup, so header text shared
+                                # by every chunk is written once on the source sheet.
+                                self._apply_metadata_header(
+                                    sheet, sheet_excel_settings, input_file.name,
+                                    left_text=sheet_name,
+                                )
                             work_regions = []
                             for region in regions:
                                 row_limit = sheet_excel_settings.row_dimensions
@@ -346,13 +400,42 @@ class ExcelConverter(Converter):
                                         ))
                                 else:
                                     work_regions.append(region)
+                            # An authored PrintArea prints as laid out, blank
+                            # bands included.
+                            if (
+                                len(work_regions) > len(regions)
+                                and sheet_excel_settings.print_area_policy != "preserve"
+                            ):
+                                work_regions = self._drop_blank_chunks(sheet, work_regions)
                             weight = sheet_weight / len(work_regions)
+                            # Work regions are already row-limited; one shallow copy
+                            # of the settings serves every chunk of this sheet.
+                            chunk_settings = (
+                                dataclasses.replace(sheet_excel_settings, row_dimensions=0)
+                                if sheet_excel_settings.row_dimensions is not None
+                                else sheet_excel_settings
+                            )
+                            # Row chunks of one region share its columns, so the
+                            # range width is read once per column span.
+                            region_widths: Dict[Tuple[int, int], float] = {}
                             for region in work_regions:
-                                new_sheet = self._copy_region_sheet(workbook, sheet, region)
-                                temp_sheets_to_delete.append(new_sheet)
-                                chunk_settings = ExcelSettings(**dataclasses.asdict(sheet_excel_settings))
+                                if export_workbook is None:
+                                    # The first chunk's copy creates the export
+                                    # workbook, so it inherits the source theme.
+                                    export_workbook = self._open_export_workbook(sheet)
+                                    new_sheet = export_workbook.Sheets(1)
+                                    self._set_region_print_area(new_sheet, region)
+                                else:
+                                    # The export workbook holds exactly the staged
+                                    # chunks, so its sheet count is known.
+                                    new_sheet = self._copy_region_sheet(
+                                        export_workbook, sheet, region,
+                                        sheet_count=len(final_sheets_to_process),
+                                    )
+                                # Staged before page setup so an oversized skip
+                                # also deletes the copy that raised.
+                                final_sheets_to_process.append(new_sheet)
                                 if sheet_excel_settings.row_dimensions is not None:
-                                    chunk_settings.row_dimensions = 0
                                     if sheet_excel_settings.oversized_action == "paginate":
                                         # A fixed row chunk is now a maximum region,
                                         # not a promise that Excel must shrink it to
@@ -370,28 +453,37 @@ class ExcelConverter(Converter):
                                     new_sheet.Cells(region.first_row, region.first_col),
                                     new_sheet.Cells(region.last_row, region.last_col),
                                 )
+                                column_span = (region.first_col, region.last_col)
+                                if column_span not in region_widths:
+                                    region_widths[column_span] = float(region_range.Width)
                                 self._apply_page_setup(
                                     new_sheet, chunk_settings, input_file.name,
                                     region.last_col,
-                                    content_width_points=float(region_range.Width),
+                                    content_width_points=region_widths[column_span],
                                     content_height_points=float(region_range.Height),
                                 )
                                 if sheet_excel_settings.metadata_header:
-                                    self._apply_metadata_header(
-                                        new_sheet, sheet_excel_settings, input_file.name,
-                                        f"{region.first_row}-{region.last_row}", left_text=sheet.Name,
+                                    self._set_center_header(
+                                        new_sheet, f"{region.first_row}-{region.last_row}"
                                     )
-                                final_sheets_to_process.append(new_sheet)
                                 if on_progress:
                                     on_progress(weight)
                         
                         except OversizedSheetError:
                             # Skip is atomic at sheet level: discard any chunks
                             # staged before a later chunk proved oversized.
+                            if sheet_output_start == 0 and export_workbook is not None:
+                                # A workbook cannot lose its last sheet; one that
+                                # holds only this sheet's chunks is dropped whole.
+                                export_workbook.Close(SaveChanges=False)
+                                export_workbook = None
+                            else:
+                                for staged in final_sheets_to_process[sheet_output_start:]:
+                                    staged.Delete()
                             del final_sheets_to_process[sheet_output_start:]
                             expected_page_count = sheet_expected_page_count
                             exact_page_count = sheet_exact_page_count
-                            skipped_sheets.append(sheet.Name)
+                            skipped_sheets.append(sheet_name)
                             if on_progress:
                                 on_progress(sheet_weight)
                             continue
@@ -400,37 +492,35 @@ class ExcelConverter(Converter):
                     if skipped_sheets:
                         logger.warning(f"Skipped {len(skipped_sheets)} oversized sheet(s): {', '.join(skipped_sheets)}")
                     
-                    # Export to PDF
-                    if final_sheets_to_process:
-                        import os
-                        import tempfile
-                        from pypdf import PdfReader
-                        fd, stage_name = tempfile.mkstemp(
-                            prefix=f".{out_file.name}.", suffix=".stage.pdf", dir=str(out_file.parent)
-                        )
-                        os.close(fd)
-                        stage = Path(stage_name)
-                        try:
-                            stage.unlink(missing_ok=True)
-                            self._export_to_pdf(workbook, final_sheets_to_process, str(stage), settings)
-                            if not stage.is_file() or stage.stat().st_size == 0:
-                                raise ValueError("Excel export did not create a nonempty PDF")
-                            exported = PdfReader(str(stage))
-                            if not exported.pages:
-                                raise ValueError("Excel export created a PDF with no pages")
-                            if exact_page_count and len(exported.pages) != expected_page_count:
-                                raise ValueError(
-                                    f"Excel exported {len(exported.pages)} pages; expected exactly "
-                                    f"{expected_page_count} one-page regions"
-                                )
-                            os.replace(stage, out_file)
-                        finally:
-                            stage.unlink(missing_ok=True)
-                        elapsed = time.time() - start_time
-                        mins, secs = divmod(int(elapsed), 60)
-                        logger.success(f"Successfully converted: {out_file} [{mins:02d}:{secs:02d}]")
-                    else:
+                    # Export to PDF. Every chunk goes out in one call so Excel
+                    # numbers pages (&P/&N) across the whole workbook.
+                    if not final_sheets_to_process:
                         raise ValueError("Workbook contains no exportable content")
+                    from pypdf import PdfReader
+                    fd, stage_name = tempfile.mkstemp(
+                        prefix=f".{out_file.name}.", suffix=".stage.pdf", dir=str(out_file.parent)
+                    )
+                    os.close(fd)
+                    stage = Path(stage_name)
+                    try:
+                        stage.unlink(missing_ok=True)
+                        self._export_to_pdf(export_workbook, str(stage), settings)
+                        if not stage.is_file() or stage.stat().st_size == 0:
+                            raise ValueError("Excel export did not create a nonempty PDF")
+                        exported = PdfReader(str(stage))
+                        if not exported.pages:
+                            raise ValueError("Excel export created a PDF with no pages")
+                        if exact_page_count and len(exported.pages) != expected_page_count:
+                            raise ValueError(
+                                f"Excel exported {len(exported.pages)} pages; expected exactly "
+                                f"{expected_page_count} one-page regions"
+                            )
+                        os.replace(stage, out_file)
+                    finally:
+                        stage.unlink(missing_ok=True)
+                    elapsed = time.time() - start_time
+                    mins, secs = divmod(int(elapsed), 60)
+                    logger.success(f"Successfully converted: {out_file} [{mins:02d}:{secs:02d}]")
                     
                 except Exception as e:
                     logger.error(f"Failed to convert {input_file.name}: {e}")
@@ -439,17 +529,22 @@ class ExcelConverter(Converter):
                         logger.warning("Excel crashed or became unavailable. This file will be skipped.")
                     raise
                 finally:
-                    # Cleanup temps
-                    if temp_sheets_to_delete:
+                    # Chunk copies live in their own workbook. Header, label and
+                    # path-row edits on the source are discarded when it closes
+                    # without saving below.
+                    if export_workbook:
                         try:
-                            excel.DisplayAlerts = False
+                            export_workbook.Close(SaveChanges=False)
+                        except Exception:
+                            pass
+                    
+                    # Calculation mode is application-wide and can only be set
+                    # while a workbook is open, so restore it before closing.
+                    if previous_calculation is not None:
+                        try:
+                            excel.Calculation = previous_calculation
                         except:
                             pass
-                        for t in temp_sheets_to_delete:
-                            try:
-                                t.Delete()
-                            except:
-                                pass
                     
                     if workbook:
                         try:
@@ -550,6 +645,9 @@ class ExcelConverter(Converter):
                     # Workbook.Sheets order is retained for deterministic PDF page order.
                     if not visible:
                         raise ValueError("Workbook contains no visible exportable sheets")
+                    match_paths = compute_match_paths(input_file, base_path)
+                    sheet_rules = load_excel_sheet_rules()
+                    sheet_settings_cache: Dict[Tuple[int, ...], PDFConversionSettings] = {}
                     page_cursor = 1
                     sheet_pdf_paths: List[Path] = []
                     all_sentinels: List[str] = []
@@ -561,7 +659,9 @@ class ExcelConverter(Converter):
                         for item_index, sheet_info in enumerate(visible):
                             sheet = workbook.Sheets.Item(sheet_info.index)
                             sheet_settings = get_excel_sheet_settings(
-                                sheet_info.name, settings, input_file, base_path
+                                sheet_info.name, settings, input_file, base_path,
+                                match_paths=match_paths, rules=sheet_rules,
+                                cache=sheet_settings_cache,
                             )
                             excel_settings = sheet_settings.excel or root_excel_settings
                             require_supported_extensions(
@@ -590,29 +690,28 @@ class ExcelConverter(Converter):
                                     raise ValueError(
                                         f"Sheet {sheet_info.name!r} authored layout enables Draft mode"
                                     )
+                                # One UsedRange proxy serves preflight, discovery and chunking.
+                                used_range = self._used_range(sheet)
                                 source_min_font = self._font_preflight(
-                                    workbook, sheet, excel_settings
+                                    workbook, sheet, excel_settings, used_range
                                 )
                                 preserve_authored = (
                                     snapshot.classification == "authored"
                                     and excel_settings.layout_policy != "force_optimize"
                                 )
+                                sheet_pdf = staging_dir / f"sheet-{item_index + 1:04d}.pdf"
                                 with self._timed_phase("staging"):
                                     staged, decision, sentinels, expected = self._stage_quality_sheet(
                                         workbook, sheet, sheet_info.index, input_file,
                                         excel_settings, capability, snapshot,
                                         preserve_authored, resolver,
                                         tuple(calculation_evidence),
-                                        source_min_font,
+                                        source_min_font, sheet_pdf, sheet_settings,
+                                        used_range,
                                     )
                                 staged_sheets.extend(staged)
                                 all_sentinels.extend(sentinels)
                                 decisions.append(decision)
-                                sheet_pdf = staging_dir / f"sheet-{item_index + 1:04d}.pdf"
-                                with self._timed_phase("export"):
-                                    self._export_quality_units(
-                                        staged, sheet_pdf, sheet_settings
-                                    )
                                 reader = PdfReader(str(sheet_pdf))
                                 page_count = len(reader.pages)
                                 expectation = PdfQualityExpectation(
@@ -717,11 +816,23 @@ class ExcelConverter(Converter):
         app.AskToUpdateLinks = False
         if settings.calculation_policy == "saved_cache":
             try:
-                app.Calculation = -4135  # xlCalculationManual
+                app.Calculation = xlCalculationManual
             except Exception as exc:
                 if settings.quality_profile == "strict":
                     raise ValueError(f"Cannot select saved-cache calculation mode: {exc}") from exc
 
+    @staticmethod
+    def _suspend_calculation(app: Any) -> Optional[int]:
+        """Switch Excel to manual calculation and return the mode to restore."""
+        try:
+            previous = int(app.Calculation)
+            if previous != xlCalculationManual:
+                app.Calculation = xlCalculationManual
+            return previous
+        except Exception as exc:
+            logger.debug(f"Could not switch Excel to manual calculation: {exc}")
+            return None
+
     @staticmethod
     def _execute_calculation_policy(
         app: Any, workbook: Any, settings: ExcelSettings,
@@ -790,8 +901,11 @@ class ExcelConverter(Converter):
         resolver: PrintableContentResolver,
         calculation_evidence: Tuple[str, ...],
         source_min_font: Optional[float],
+        sheet_pdf: Path,
+        pdf_settings: PDFConversionSettings,
+        used_range: Any = None,
     ) -> Tuple[List[Any], LayoutDecision, List[str], int]:
-        """Document this Excel pipeline operation and its side effects."""
+        """Lay out and export one sheet to ``sheet_pdf``; return sheets to delete."""
         strict = excel_settings.quality_profile == "strict"
         if (
             strict and source_min_font is not None
@@ -815,6 +929,8 @@ class ExcelConverter(Converter):
             with self._timed_phase("pagination"):
                 evidence = self._probe_pagination(copied, excel_settings, None)
             sentinels = self._boundary_sentinels(sheet, ())
+            with self._timed_phase("export"):
+                self._export_quality_units([copied], sheet_pdf, pdf_settings)
             decision = LayoutDecision(
                 workbook=input_file.name, sheet=str(sheet.Name),
                 sheet_index=sheet_index, mode="authored" if preserve_authored else "chart",
@@ -836,7 +952,8 @@ class ExcelConverter(Converter):
             )
 
         content = resolver.resolve(
-            sheet, excel_settings.print_area_policy, strict=strict
+            sheet, excel_settings.print_area_policy, strict=strict,
+            used_range=used_range,
         )
         if not content.regions:
             detail = "; ".join(content.errors) or "no printable content"
@@ -846,32 +963,26 @@ class ExcelConverter(Converter):
                 f"Sheet {sheet.Name!r}: uncertain content discovery: "
                 + "; ".join(content.errors)
             )
-        atomic_ranges = self._atomic_row_ranges(sheet, content.objects)
+        atomic_ranges = self._atomic_row_ranges(sheet, content.objects, used_range)
         forbidden = SafeChunkPlanner.forbidden_row_boundaries(
             atomic_ranges, content.objects
         )
         chunks = SafeChunkPlanner().chunks(
             content.regions, excel_settings.row_dimensions, forbidden
         )
-        staged: List[Any] = []
-        measurements: List[Tuple[Any, SheetRegion, float, float]] = []
+        measurements: List[Tuple[SheetRegion, str, float, float]] = []
         for chunk in chunks:
             region = SheetRegion(
                 chunk.first_row, chunk.first_col,
                 chunk.last_row, chunk.last_col,
             )
-            copied = self._copy_region_sheet(workbook, sheet, region)
-            staged.append(copied)
-            self._apply_quality_metadata(
-                copied, excel_settings, input_file.name, str(sheet.Name),
-                f"{chunk.first_row}-{chunk.last_row}",
-            )
-            cell_range = copied.Range(
-                copied.Cells(region.first_row, region.first_col),
-                copied.Cells(region.last_row, region.last_col),
+            cell_range = sheet.Range(
+                sheet.Cells(region.first_row, region.first_col),
+                sheet.Cells(region.last_row, region.last_col),
             )
             measurements.append((
-                copied, region, float(cell_range.Width), float(cell_range.Height)
+                region, f"{chunk.first_row}-{chunk.last_row}",
+                float(cell_range.Width), float(cell_range.Height),
             ))
         if not measurements:
             raise ValueError(f"Sheet {sheet.Name!r} produced no safe chunks")
@@ -888,38 +999,65 @@ class ExcelConverter(Converter):
             )
         max_width = max(item[2] for item in measurements)
         max_height = max(item[3] for item in measurements)
-        first_sheet, first_region, first_width, first_height = measurements[0]
+        _, _, first_width, first_height = measurements[0]
         planning_width = (
             max_width if excel_settings.page_size_scope == "sheet" else first_width
         )
         planning_height = (
             max_height if excel_settings.page_size_scope == "sheet" else first_height
         )
-        with self._timed_phase("printer_layout"):
-            selected = self._apply_page_setup(
-                first_sheet, planning_settings, input_file.name,
-                first_region.last_col, planning_width, planning_height,
-            )
+        authored_headers = (
+            {
+                name: str(getattr(sheet.PageSetup, name, "") or "")
+                for name in ("LeftHeader", "CenterHeader", "RightHeader")
+            }
+            if excel_settings.metadata_header_policy == "append" else None
+        )
+        # Chunks are not copied: each one rewrites the source sheet's PrintArea,
+        # header and PageSetup and is exported before the next chunk takes over.
+        selected: Optional[LayoutCandidate] = None
+        first_zoom = 0
         actual_grids = []
-        for index, (copied, region, width, height) in enumerate(measurements):
-            applied = selected
-            if planning_settings.page_size_scope == "sheet" and index > 0:
-                with self._timed_phase("printer_layout"):
-                    applied = self._apply_page_setup(
-                        copied, planning_settings, input_file.name,
-                        region.last_col, width, height,
-                        forced_layout=selected,
-                    )
-            elif index > 0:
+        unit_paths: List[Path] = []
+        try:
+            for index, (region, row_label, width, height) in enumerate(measurements):
+                self._set_region_print_area(sheet, region)
+                self._apply_quality_metadata(
+                    sheet, excel_settings, input_file.name, str(sheet.Name),
+                    row_label, authored_headers,
+                )
                 with self._timed_phase("printer_layout"):
-                    applied = self._apply_page_setup(
-                        copied, planning_settings, input_file.name,
-                        region.last_col, width, height,
-                    )
-            with self._timed_phase("pagination"):
-                evidence = self._probe_pagination(copied, planning_settings, applied)
-            self._verify_metadata_margins(copied, planning_settings)
-            actual_grids.append((evidence.pages_wide, evidence.pages_tall))
+                    if index == 0:
+                        selected = applied = self._apply_page_setup(
+                            sheet, planning_settings, input_file.name,
+                            region.last_col, planning_width, planning_height,
+                        )
+                    elif planning_settings.page_size_scope == "sheet":
+                        applied = self._apply_page_setup(
+                            sheet, planning_settings, input_file.name,
+                            region.last_col, width, height,
+                            forced_layout=selected,
+                        )
+                    else:
+                        applied = self._apply_page_setup(
+                            sheet, planning_settings, input_file.name,
+                            region.last_col, width, height,
+                        )
+                with self._timed_phase("pagination"):
+                    evidence = self._probe_pagination(sheet, planning_settings, applied)
+                self._verify_metadata_margins(sheet, planning_settings)
+                actual_grids.append((evidence.pages_wide, evidence.pages_tall))
+                if index == 0:
+                    first_zoom = int(sheet.PageSetup.Zoom)
+                unit = self._quality_unit_path(sheet_pdf, index)
+                with self._timed_phase("export"):
+                    self._export_quality_unit(sheet, unit, pdf_settings)
+                unit_paths.append(unit)
+            with self._timed_phase("export"):
+                self._merge_quality_units(unit_paths, sheet_pdf)
+        finally:
+            for unit in unit_paths:
+                unit.unlink(missing_ok=True)
         preferred = {
             name.casefold(): rank
             for rank, name in enumerate(excel_settings.preferred_papers)
@@ -933,11 +1071,11 @@ class ExcelConverter(Converter):
             width_scale=selected.width_scale,
             height_scale=selected.height_scale,
             effective_scale=selected.effective_scale,
-            zoom=int(first_sheet.PageSetup.Zoom),
+            zoom=first_zoom,
             pages_wide=selected.pages_wide,
             pages_tall=selected.pages_tall,
             effective_font_pt=(
-                source_min_font * int(first_sheet.PageSetup.Zoom) / 100.0
+                source_min_font * first_zoom / 100.0
                 if source_min_font is not None else None
             ),
             effective_image_dpi=None,
@@ -967,7 +1105,7 @@ class ExcelConverter(Converter):
             max(1, pages_wide * pages_tall)
             for pages_wide, pages_tall in actual_grids
         )
-        return staged, decision, sentinels, expected_pages
+        return [], decision, sentinels, expected_pages
 
     @staticmethod
     def _layout_values_match(first: Any, second: Any) -> bool:
@@ -989,13 +1127,25 @@ class ExcelConverter(Converter):
         return workbook.Sheets(workbook.Sheets.Count)
 
     @staticmethod
-    def _atomic_row_ranges(sheet: Any, objects: Tuple[Any, ...]) -> List[Tuple[int, int]]:
+    def _used_range(sheet: Any) -> Any:
+        """Return the sheet's UsedRange proxy, or None when it cannot be read."""
+        try:
+            return sheet.UsedRange
+        except Exception:
+            return None
+
+    @staticmethod
+    def _atomic_row_ranges(
+        sheet: Any, objects: Tuple[Any, ...], used_range: Any = None,
+    ) -> List[Tuple[int, int]]:
         """Document this Excel pipeline operation and its side effects."""
         ranges: List[Tuple[int, int]] = [
             (item.first_row, item.last_row) for item in objects
         ]
         try:
-            merge_areas = sheet.UsedRange.MergeAreas
+            if used_range is None:
+                used_range = sheet.UsedRange
+            merge_areas = used_range.MergeAreas
             for index in range(1, int(merge_areas.Count) + 1):
                 area = merge_areas.Item(index)
                 ranges.append((int(area.Row), int(area.Row + area.Rows.Count - 1)))
@@ -1068,8 +1218,9 @@ class ExcelConverter(Converter):
     def _apply_quality_metadata(
         self, sheet: Any, settings: ExcelSettings, filename: str,
         sheet_name: str, row_label: str,
+        authored_headers: Optional[Dict[str, str]] = None,
     ) -> None:
-        """Document this Excel pipeline operation and its side effects."""
+        """Write metadata headers; ``authored_headers`` is the base for append."""
         if not settings.metadata_header or settings.metadata_header_policy == "preserve":
             return
         setup = sheet.PageSetup
@@ -1080,7 +1231,10 @@ class ExcelConverter(Converter):
         }
         for name, value in values.items():
             if settings.metadata_header_policy == "append":
-                existing = str(getattr(setup, name, "") or "")
+                existing = (
+                    authored_headers[name] if authored_headers is not None
+                    else str(getattr(setup, name, "") or "")
+                )
                 value = f"{existing} | {value}" if existing else value
             if len(value) > 255:
                 raise ValueError(f"Excel header {name} exceeds 255 characters")
@@ -1122,31 +1276,48 @@ class ExcelConverter(Converter):
         return list(dict.fromkeys(values))
 
     @staticmethod
-    def _export_quality_units(
-        sheets: Sequence[Any], output: Path, settings: PDFConversionSettings,
+    def _quality_unit_path(output: Path, index: int) -> Path:
+        """Return the hidden per-unit PDF path staged beside ``output``."""
+        return output.with_name(f".{output.stem}.unit-{index + 1:04d}.pdf")
+
+    @staticmethod
+    def _export_quality_unit(
+        sheet: Any, unit: Path, settings: PDFConversionSettings,
     ) -> None:
-        """Document this Excel pipeline operation and its side effects."""
+        """Export the sheet's current print area to ``unit`` and check the file."""
+        unit.unlink(missing_ok=True)
+        sheet.ExportAsFixedFormat(
+            Type=xlTypePDF, Filename=str(unit), Quality=xlQualityStandard,
+            IncludeDocProperties=settings.metadata.include_properties,
+            IgnorePrintAreas=False, OpenAfterPublish=False,
+        )
+        if not unit.is_file() or unit.stat().st_size == 0:
+            raise ValueError(f"Excel did not create PDF for sheet {sheet.Name!r}")
+
+    @staticmethod
+    def _merge_quality_units(unit_paths: Sequence[Path], output: Path) -> None:
+        """Concatenate unit PDFs into ``output`` in order."""
         from pypdf import PdfReader, PdfWriter
 
+        writer = PdfWriter()
+        for unit in unit_paths:
+            for page in PdfReader(str(unit)).pages:
+                writer.add_page(page)
+        with output.open("wb") as stream:
+            writer.write(stream)
+
+    @classmethod
+    def _export_quality_units(
+        cls, sheets: Sequence[Any], output: Path, settings: PDFConversionSettings,
+    ) -> None:
+        """Export each staged sheet as one unit and merge them into ``output``."""
         unit_paths: List[Path] = []
         try:
             for index, sheet in enumerate(sheets):
-                unit = output.with_name(f".{output.stem}.unit-{index + 1:04d}.pdf")
-                unit.unlink(missing_ok=True)
-                sheet.ExportAsFixedFormat(
-                    Type=xlTypePDF, Filename=str(unit), Quality=xlQualityStandard,
-                    IncludeDocProperties=settings.metadata.include_properties,
-                    IgnorePrintAreas=False, OpenAfterPublish=False,
-                )
-                if not unit.is_file() or unit.stat().st_size == 0:
-                    raise ValueError(f"Excel did not create PDF for sheet {sheet.Name!r}")
+                unit = cls._quality_unit_path(output, index)
+                cls._export_quality_unit(sheet, unit, settings)
                 unit_paths.append(unit)
-            writer = PdfWriter()
-            for unit in unit_paths:
-                for page in PdfReader(str(unit)).pages:
-                    writer.add_page(page)
-            with output.open("wb") as stream:
-                writer.write(stream)
+            cls._merge_quality_units(unit_paths, output)
         finally:
             for unit in unit_paths:
                 unit.unlink(missing_ok=True)
@@ -1167,6 +1338,7 @@ class ExcelConverter(Converter):
     @staticmethod
     def _font_preflight(
         workbook: Any, sheet: Any, settings: ExcelSettings,
+        used_range: Any = None,
     ) -> Optional[float]:
         """Document this Excel pipeline operation and its side effects."""
         if settings.quality_profile != "strict":
@@ -1176,7 +1348,9 @@ class ExcelConverter(Converter):
         inventory_errors: List[str] = []
         for cell_type in (2, -4123):  # constants, formulas
             try:
-                cells = sheet.UsedRange.SpecialCells(cell_type).Cells
+                if used_range is None:
+                    used_range = sheet.UsedRange
+                cells = used_range.SpecialCells(cell_type).Cells
                 for index in range(1, int(cells.Count) + 1):
                     font = cells.Item(index).Font
                     name = str(font.Name or "").strip()
@@ -1273,6 +1447,7 @@ class ExcelConverter(Converter):
                     # Compatibility for legacy callers and older test harnesses.
                     # Quality profiles require DispatchEx and never take this path.
                     excel = win32com.client.Dispatch("Excel.Application")
+                excel = self._early_bound(excel)
                 if self._process_recorder:
                     try:
                         _, process_id = win32process.GetWindowThreadProcessId(excel.Hwnd)
@@ -1339,6 +1514,33 @@ class ExcelConverter(Converter):
                 with self._timed_phase("cleanup"):
                     self._safe_quit_excel(excel)
 
+    @staticmethod
+    def _early_bound(excel):
+        """
+        Wrap an Excel instance in its makepy-generated early-bound class.
+
+        Early-bound proxies cache dispatch IDs from the type library instead of
+        resolving every property name with GetIDsOfNames, which matters for the
+        dense PageSetup writes. Wrapping keeps the DispatchEx process isolation.
+        Parallel CLI jobs would race to write the same gen_py module, so the
+        build is serialised by a named mutex. A missing or unwritable gen_py
+        cache, or a build that stays locked, falls back to late binding.
+        """
+        try:
+            mutex = win32event.CreateMutex(None, False, _GENCACHE_MUTEX_NAME)
+            if win32event.WaitForSingleObject(
+                mutex, _GENCACHE_WAIT_MS
+            ) == win32event.WAIT_TIMEOUT:
+                logger.debug("gen_py cache is still locked, using late-bound Excel")
+                return excel
+            try:
+                return win32com.client.gencache.EnsureDispatch(excel)
+            finally:
+                win32event.ReleaseMutex(mutex)
+        except Exception as exc:
+            logger.debug(f"Early binding unavailable, using late-bound Excel: {exc}")
+            return excel
+
     def _kill_zombie_excel(self) -> None:
         """Compatibility no-op; global Excel termination is intentionally disabled."""
         logger.debug("Global Excel process termination is disabled")
@@ -1371,7 +1573,8 @@ class ExcelConverter(Converter):
     def _set_optimal_printer(self, excel) -> None:
         """
         Attempt to set ActivePrinter to 'Microsoft Print to PDF' for better paper size support.
-        Uses win32print API for reliable port detection, with brute-force fallback.
+        Uses the per-user Devices registry entry (the NeXX: port Excel expects)
+        and the win32print API for port detection, with brute-force fallback.
         
         IMPORTANT: Avoids printers with PORTPROMPT: port which would show a dialog.
         """
@@ -1412,61 +1615,104 @@ class ExcelConverter(Converter):
             )
             return
 
-        # If we got a port name from the API, try it first
+        # Excel names printers by the NeXX: port recorded in the Devices key,
+        # so that entry normally yields the one correct string.
         candidates = []
-        if port_name:
+        devices_port = self._devices_registry_port(target_name)
+        if devices_port:
+            candidates.append(f"{target_name} on {devices_port}")
+        if port_name and port_name != devices_port:
             candidates.append(f"{target_name} on {port_name}")
         
-        # Strategy 2: Brute force Ne00-Ne99 as fallback (expanded range)
-        for i in range(100):
-            candidates.append(f"{target_name} on Ne{i:02d}:")
-            
-        # Strategy 3: Naked name (rare, but might work)
+        # Strategy 2: Naked name (rare, but a single attempt before the sweep)
         candidates.append(target_name)
-        
-        success = False
-        for candidate in candidates:
-            try:
-                # Ensure dialogs are suppressed before each attempt
-                excel.DisplayAlerts = False
-                excel.Interactive = False
-                excel.ActivePrinter = candidate
-                logger.info(f"Successfully switched ActivePrinter to: '{candidate}'")
-                success = True
-                break
-            except Exception as e:
-                # Only log first few failures to avoid spam
-                if candidates.index(candidate) < 5:
-                    logger.debug(f"Failed to set ActivePrinter to '{candidate}': {e}")
-                
-        if not success:
-            logger.warning(
-                f"Could not set ActivePrinter to '{target_name}'. "
-                f"Using default printer. Large paper sizes (A3) may rely on default printer capabilities."
-            )
+
+        for attempt, candidate in enumerate(candidates):
+            if self._try_active_printer(excel, candidate, log_failure=attempt < 5):
+                return
+
+        # Strategy 3: Brute force Ne00-Ne99 as a last resort
+        for i in range(100):
+            candidate = f"{target_name} on Ne{i:02d}:"
+            if self._try_active_printer(excel, candidate, log_failure=i < 5):
+                return
+
+        logger.warning(
+            f"Could not set ActivePrinter to '{target_name}'. "
+            f"Using default printer. Large paper sizes (A3) may rely on default printer capabilities."
+        )
+
+    @staticmethod
+    def _try_active_printer(excel, candidate: str, log_failure: bool) -> bool:
+        """Assign ``candidate`` to ActivePrinter; return False if Excel rejects it."""
+        try:
+            # Ensure dialogs are suppressed before each attempt
+            excel.DisplayAlerts = False
+            excel.Interactive = False
+            excel.ActivePrinter = candidate
+        except pywintypes.com_error as e:
+            # Only log first few failures to avoid spam
+            if log_failure:
+                logger.debug(f"Failed to set ActivePrinter to '{candidate}': {e}")
+            return False
+        logger.info(f"Successfully switched ActivePrinter to: '{candidate}'")
+        return True
+
+    @staticmethod
+    def _devices_registry_port(printer_name: str) -> Optional[str]:
+        """
+        Read a printer's port from the per-user ``Devices`` registry key.
+
+        Values there have the form ``"winspool,Ne01:"``; the second field is the
+        port Excel uses in ``ActivePrinter``. Returns None when unavailable.
+        """
+        try:
+            import winreg
+
+            with winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                r"Software\Microsoft\Windows NT\CurrentVersion\Devices",
+            ) as key:
+                value, _ = winreg.QueryValueEx(key, printer_name)
+        except (ImportError, OSError) as e:
+            logger.debug(f"Devices registry lookup failed for '{printer_name}': {e}")
+            return None
+        fields = str(value).split(",")
+        port = fields[1].strip() if len(fields) > 1 else ""
+        return port or None
 
     def _get_sheets_to_export(self, workbook, excel_settings: ExcelSettings) -> List:
         """Get list of sheets to export based on settings."""
         sheets = []
         
-        for sheet in workbook.Worksheets:
+        if excel_settings.sheet_name:
+            # A named sheet is fetched directly instead of scanning every
+            # worksheet's Name and Visible over COM.
+            try:
+                candidates = [workbook.Worksheets(excel_settings.sheet_name)]
+            except Exception:
+                candidates = []
+        else:
+            candidates = workbook.Worksheets
+        
+        for sheet in candidates:
+            name = sheet.Name
+            # Worksheets(name) matches case-insensitively; keep the exact match.
+            if excel_settings.sheet_name and name != excel_settings.sheet_name:
+                continue
+            
             # Only process visible sheets
             if sheet.Visible != xlSheetVisible:
                 continue
-                
-            # Filter by sheet name if specified
-            if excel_settings.sheet_name:
-                if sheet.Name != excel_settings.sheet_name:
-                    continue
             
             # Validate that the sheet has a proper PageSetup object
             # Some sheet types (dialog sheets, macro sheets) may not support PageSetup
             if not self._has_valid_page_setup(sheet):
-                logger.warning(f"Skipping sheet '{sheet.Name}': PageSetup not supported")
+                logger.warning(f"Skipping sheet '{name}': PageSetup not supported")
                 continue
             
             sheets.append(sheet)
-            logger.debug(f"Will export sheet: {sheet.Name}")
+            logger.debug(f"Will export sheet: {name}")
         
         return sheets
 
@@ -1556,9 +1802,11 @@ class ExcelConverter(Converter):
             else:
                 content_height_inches = self.DEFAULT_PAGE_HEIGHT_INCHES
             
-            logger.debug(
-                f"Sheet '{sheet.Name}' (Cols 1-{last_col_index}): "
-                f"Content: {content_width_inches:.2f}\" x {content_height_inches:.2f}\""
+            # Called for every chunk; the sheet name is read only if DEBUG is emitted.
+            logger.opt(lazy=True).debug(
+                f"Sheet '{{}}' (Cols 1-{last_col_index}): "
+                f"Content: {content_width_inches:.2f}\" x {content_height_inches:.2f}\"",
+                lambda: sheet.Name,
             )
             
             return content_width_inches, content_height_inches
@@ -1718,6 +1966,26 @@ class ExcelConverter(Converter):
             logger.debug(f"Failed to set PageSetup.{prop_name}: {e}")
             return False
 
+    @staticmethod
+    def _set_page_properties(page_setup, values: Dict[str, Any]) -> None:
+        """
+        Write several required PageSetup properties in order.
+
+        The PageSetup object is validated once and nothing is read back here;
+        callers commit with PrintCommunication and verify the values afterwards.
+        """
+        try:
+            _ = page_setup.Application
+        except Exception as exc:
+            raise ValueError(f"PageSetup object is invalid: {exc}") from exc
+        for prop_name, value in values.items():
+            try:
+                setattr(page_setup, prop_name, value)
+            except Exception as exc:
+                raise ValueError(
+                    f"Excel rejected required PageSetup.{prop_name}={value!r}"
+                ) from exc
+
     def _required_set_page_property(self, page_setup, prop_name: str, value) -> None:
         """Set, commit and read back a required Excel PageSetup property."""
         if not self._safe_set_page_property(page_setup, prop_name, value):
@@ -1857,12 +2125,23 @@ class ExcelConverter(Converter):
         orientation: int,
         requested_margins: Tuple[float, float, float, float],
         require_imageable_area: bool = False,
+        active_printer: Optional[str] = None,
     ) -> Optional[Tuple[float, float, float, float]]:
-        """Set a paper/orientation pair and return committed margins in points."""
-        try:
-            printer_name = str(page_setup.Application.ActivePrinter or "").casefold()
-        except Exception:
-            printer_name = "<unknown-printer>"
+        """
+        Set a paper/orientation pair and return committed margins in points.
+
+        ``active_printer`` lets callers probing many forms read
+        ``Application.ActivePrinter`` once instead of once per probe.
+        """
+        if active_printer is None:
+            try:
+                active_printer = str(page_setup.Application.ActivePrinter or "")
+            except Exception:
+                active_printer = None
+        printer_name = (
+            active_printer.casefold() if active_printer is not None
+            else "<unknown-printer>"
+        )
         cache_key = (
             printer_name,
             int(form.paper_enum),
@@ -1881,7 +2160,8 @@ class ExcelConverter(Converter):
         margins = requested_margins
         if require_imageable_area:
             try:
-                active_printer = str(page_setup.Application.ActivePrinter or "")
+                if active_printer is None:
+                    raise ValueError("Excel ActivePrinter is unavailable")
                 hard = self._printer_capabilities.hard_margins_points(
                     active_printer, form.paper_enum, orientation
                 )
@@ -2247,6 +2527,10 @@ class ExcelConverter(Converter):
         planned_content_height = content_height + title_extra_height
         candidates: List[LayoutCandidate] = []
         forms = self._get_printer_paper_forms(app)
+        try:
+            active_printer: Optional[str] = str(app.ActivePrinter or "")
+        except Exception:
+            active_printer = None
         allowed = (
             {name.casefold() for name in excel_settings.allowed_papers}
             if excel_settings.allowed_papers else None
@@ -2266,6 +2550,7 @@ class ExcelConverter(Converter):
                     require_imageable_area=(
                         excel_settings.quality_profile == "strict"
                     ),
+                    active_printer=active_printer,
                 )
                 if actual_margins is None:
                     continue
@@ -2405,35 +2690,13 @@ class ExcelConverter(Converter):
                     f"Sheet '{sheet.Name}' requires horizontal pagination"
                 )
 
-        self._required_set_page_property(page_setup, "PaperSize", selected.form.paper_enum)
-        self._required_set_page_property(page_setup, "Orientation", selected.orientation)
-        for prop_name, value in zip(
-            ("LeftMargin", "RightMargin", "TopMargin", "BottomMargin"),
-            selected.margins_points,
-            strict=True,
-        ):
-            self._required_set_page_property(page_setup, prop_name, value)
-        if use_fit_to_pages:
-            self._required_set_page_property(page_setup, "Zoom", False)
-            self._required_set_page_property(page_setup, "FitToPagesWide", 1)
-            self._required_set_page_property(
-                page_setup, "FitToPagesTall", 1 if fit_tall else False
-            )
-        else:
-            self._required_set_page_property(page_setup, "FitToPagesWide", False)
-            self._required_set_page_property(page_setup, "FitToPagesTall", False)
-            self._required_set_page_property(page_setup, "Zoom", zoom_value)
         black_and_white = (
             preserved_black_and_white
             if excel_settings.color_policy == "preserve"
             else excel_settings.color_policy == "black_and_white"
         )
-        self._required_set_page_property(page_setup, "BlackAndWhite", black_and_white)
-        if excel_settings.quality_profile != "legacy":
-            self._required_set_page_property(page_setup, "Draft", excel_settings.draft_mode)
-            if selected.pages_wide > 1 and selected.pages_tall > 1:
-                self._required_set_page_property(page_setup, "Order", 1)
-        app.PrintCommunication = True
+        # Writes are applied in this order and verified together by the single
+        # readback pass below, instead of a commit and readback per property.
         final_expected = {
             "PaperSize": selected.form.paper_enum,
             "Orientation": selected.orientation,
@@ -2441,15 +2704,27 @@ class ExcelConverter(Converter):
             "RightMargin": selected.margins_points[1],
             "TopMargin": selected.margins_points[2],
             "BottomMargin": selected.margins_points[3],
-            "Zoom": zoom_value,
-            "FitToPagesWide": 1 if use_fit_to_pages else False,
-            "FitToPagesTall": (
-                (1 if fit_tall else False) if use_fit_to_pages else False
-            ),
-            "BlackAndWhite": black_and_white,
         }
+        if use_fit_to_pages:
+            final_expected["Zoom"] = False
+            final_expected["FitToPagesWide"] = 1
+            final_expected["FitToPagesTall"] = 1 if fit_tall else False
+        else:
+            final_expected["FitToPagesWide"] = False
+            final_expected["FitToPagesTall"] = False
+            final_expected["Zoom"] = zoom_value
+        final_expected["BlackAndWhite"] = black_and_white
         if excel_settings.quality_profile != "legacy":
             final_expected["Draft"] = excel_settings.draft_mode
+            if selected.pages_wide > 1 and selected.pages_tall > 1:
+                final_expected["Order"] = 1
+        # PrintCommunication stays off while the properties are written so the
+        # printer driver is contacted once when it is switched back on.
+        app.PrintCommunication = False
+        try:
+            self._set_page_properties(page_setup, final_expected)
+        finally:
+            app.PrintCommunication = True
         for prop_name, expected in final_expected.items():
             try:
                 actual = getattr(page_setup, prop_name)
@@ -2496,52 +2771,75 @@ class ExcelConverter(Converter):
         """
         Set header text: sheet name | row range | filename
         """
+        # Only the PageSetup fetch is guarded here; each property write has its
+        # own handler, so unexpected Python errors are not silently logged.
         try:
             page_setup = sheet.PageSetup
-            
-            # Build header values
-            left_val = left_text if left_text else "&A"
-            center_val = center_text
-            right_val = f"{filename} (Page &P)"
-            
-            # Set headers directly (avoid wrapper that may silently fail)
-            try:
-                page_setup.LeftHeader = left_val
-                logger.debug(f"Set LeftHeader = '{left_val}'")
-            except Exception as e:
-                logger.warning(f"Failed to set LeftHeader: {e}")
-            
-            try:
-                page_setup.CenterHeader = center_val
-                logger.debug(f"Set CenterHeader = '{center_val}'")
-            except Exception as e:
-                logger.warning(f"Failed to set CenterHeader: {e}")
-            
-            try:
-                page_setup.RightHeader = right_val
-                logger.debug(f"Set RightHeader = '{right_val}'")
-            except Exception as e:
-                logger.warning(f"Failed to set RightHeader: {e}")
-            
-            # Clear footers to avoid clutter and potential crop issues
-            try:
-                page_setup.RightFooter = ""
-                page_setup.CenterFooter = ""
-                page_setup.LeftFooter = ""
-            except Exception as e:
-                logger.debug(f"Failed to clear footers: {e}")
-            
-            # CRITICAL: Re-enable PrintCommunication to commit header/footer changes
-            try:
-                app = sheet.Application
-                app.PrintCommunication = True
-            except:
-                pass
-            
-            logger.debug(f"Applied metadata header for sheet '{sheet.Name}' (Center: '{center_text}')")
-            
         except Exception as e:
             logger.warning(f"Could not apply metadata header for '{sheet.Name}': {e}")
+            return
+        
+        # Build header values
+        left_val = left_text if left_text else "&A"
+        center_val = center_text
+        right_val = f"{filename} (Page &P)"
+        
+        try:
+            app = sheet.Application
+            app.PrintCommunication = False
+        except Exception:
+            app = None
+
+        # Set headers directly (avoid wrapper that may silently fail)
+        try:
+            page_setup.LeftHeader = left_val
+            logger.debug(f"Set LeftHeader = '{left_val}'")
+        except Exception as e:
+            logger.warning(f"Failed to set LeftHeader: {e}")
+        
+        try:
+            page_setup.CenterHeader = center_val
+            logger.debug(f"Set CenterHeader = '{center_val}'")
+        except Exception as e:
+            logger.warning(f"Failed to set CenterHeader: {e}")
+        
+        try:
+            page_setup.RightHeader = right_val
+            logger.debug(f"Set RightHeader = '{right_val}'")
+        except Exception as e:
+            logger.warning(f"Failed to set RightHeader: {e}")
+        
+        # Clear footers to avoid clutter and potential crop issues
+        try:
+            page_setup.RightFooter = ""
+            page_setup.CenterFooter = ""
+            page_setup.LeftFooter = ""
+        except Exception as e:
+            logger.debug(f"Failed to clear footers: {e}")
+        
+        # CRITICAL: Re-enable PrintCommunication to commit header/footer changes
+        try:
+            (app or sheet.Application).PrintCommunication = True
+        except:
+            pass
+        
+        logger.debug(f"Applied metadata header for sheet '{sheet.Name}' (Center: '{center_text}')")
+
+    def _set_center_header(self, sheet, center_text: str) -> None:
+        """
+        Set the per-chunk row range header.
+
+        The remaining header and footer text is inherited from the source sheet
+        prepared by ``_apply_metadata_header`` before the chunk was copied.
+        """
+        try:
+            sheet.PageSetup.CenterHeader = center_text
+            # Called for every chunk; the sheet name is read only if DEBUG is emitted.
+            logger.opt(lazy=True).debug(
+                f"Set CenterHeader = '{center_text}' for '{{}}'", lambda: sheet.Name
+            )
+        except Exception as e:
+            logger.warning(f"Failed to set CenterHeader for '{sheet.Name}': {e}")
 
     def _insert_sheet_name_label(self, sheet, sheet_name: str) -> None:
         """
@@ -2628,11 +2926,9 @@ class ExcelConverter(Converter):
 
     def _col_num_to_letter(self, n: int) -> str:
         """Convert 1-based column number to Excel column letter (e.g. 1->A, 27->AA)."""
-        string = ""
-        while n > 0:
-            n, remainder = divmod(n - 1, 26)
-            string = chr(65 + remainder) + string
-        return string
+        if 0 < n <= XL_MAX_COLUMNS:
+            return _COL_LETTERS[n - 1]
+        return _column_letters(n)
 
     def _expand_bounds_for_shapes(
         self, 
@@ -2666,7 +2962,8 @@ class ExcelConverter(Converter):
             # First, try to get shapes count with timeout
             shapes_count = 0
             try:
-                shapes_count = sheet.Shapes.Count
+                shapes = sheet.Shapes
+                shapes_count = shapes.Count
             except Exception as e:
                 logger.debug(f"Could not access Shapes collection: {e}")
                 return max_width, max_height, last_row, last_col
@@ -2679,7 +2976,7 @@ class ExcelConverter(Converter):
             
             for i in range(1, shapes_count + 1):  # Excel shapes are 1-indexed
                 try:
-                    shape = sheet.Shapes(i)
+                    shape = shapes(i)
                     
                     # Access shape properties with individual try-except
                     # This prevents one bad shape from blocking the entire loop
@@ -2747,16 +3044,14 @@ class ExcelConverter(Converter):
     def _export_to_pdf(
         self, 
         workbook, 
-        sheets: List,
         output_path: str,
         settings: PDFConversionSettings
     ) -> None:
         """
-        Export sheets to PDF.
+        Export a workbook to PDF.
         
         Args:
-            workbook: Excel Workbook object
-            sheets: List of sheets to export
+            workbook: Export workbook holding exactly the chunks to print
             output_path: Path for output PDF
             settings: PDF conversion settings
         """
@@ -2782,104 +3077,127 @@ class ExcelConverter(Converter):
             except:
                 pass
             
-            # Determine quality
-            quality = xlQualityStandard
-            if settings.optimization.image_quality == "low":
-                quality = xlQualityMinimum
+            quality = _EXPORT_QUALITY.get(
+                settings.optimization.image_quality, xlQualityStandard
+            )
 
-            if len(sheets) == 1:
-                # Export single sheet directly
-                logger.info(f"Exporting sheet '{sheets[0].Name}' to PDF...")
-                
-                sheets[0].ExportAsFixedFormat(
-                    Type=xlTypePDF,
-                    Filename=output_path,
-                    Quality=quality,
-                    IncludeDocProperties=settings.metadata.include_properties,
-                    IgnorePrintAreas=False,
-                    OpenAfterPublish=False
-                )
-                
-                logger.debug(f"Sheet '{sheets[0].Name}' exported successfully")
-            else:
-                # Multiple sheets: Copy to new temporary workbook iteratively
-                logger.debug(f"Preparing to copy {len(sheets)} sheets to new workbook.")
-                
-                temp_wb = None
-                try:
-                    # Copy first sheet -> Creates new Workbook
-                    sheets[0].Copy()
-                    
-                    # Get the new workbook
-                    try:
-                        temp_wb = workbook.Application.ActiveWorkbook
-                        _ = temp_wb.Sheets.Count  # Validate connection
-                    except Exception as e:
-                        raise COMDisconnectedError(
-                            f"Failed to access temp workbook: {e}"
-                        ) from e
-                    
-                    logger.debug(f"Created temp WB. Sheets count: {temp_wb.Sheets.Count}")
-                    
-                    # Copy remaining sheets into the new workbook
-                    for idx, s in enumerate(sheets[1:], start=2):
-                        try:
-                            last_sheet = temp_wb.Sheets(temp_wb.Sheets.Count)
-                            # Copy after last_sheet
-                            s.Copy(None, last_sheet)
-                            logger.debug(
-                                f"Copied sheet {idx}/{len(sheets)}. "
-                                f"New count: {temp_wb.Sheets.Count}"
-                            )
-                        except Exception as copy_err:
-                            logger.error(f"Failed to copy sheet {idx}: {copy_err}")
-                            raise ValueError(
-                                f"Failed to copy sheet {idx}/{len(sheets)} "
-                                "into the temporary export workbook"
-                            ) from copy_err
-                    
-                    # Export workbook - all sheets will be included automatically
-                    count = temp_wb.Sheets.Count
-                    logger.debug(f"Exporting created workbook with {count} sheets.")
-                    
-                    logger.info(f"Exporting {count} sheets to PDF...")
-                    
-                    temp_wb.ExportAsFixedFormat(
-                        Type=xlTypePDF,
-                        Filename=output_path,
-                        Quality=quality,
-                        IncludeDocProperties=settings.metadata.include_properties,
-                        IgnorePrintAreas=False,
-                        OpenAfterPublish=False
-                    )
-                    
-                    logger.debug("Multi-sheet export completed successfully")
-                finally:
-                    if temp_wb:
-                        try:
-                            temp_wb.Close(SaveChanges=False)
-                        except Exception as close_err:
-                            logger.debug(f"Failed to close temp workbook: {close_err}")
+            logger.info("Exporting workbook to PDF...")
+
+            workbook.ExportAsFixedFormat(
+                Type=xlTypePDF,
+                Filename=output_path,
+                Quality=quality,
+                IncludeDocProperties=settings.metadata.include_properties,
+                IgnorePrintAreas=False,
+                OpenAfterPublish=False
+            )
+
+            logger.debug("Export completed successfully")
 
-            
         except COMDisconnectedError:
             raise  # Re-raise to caller
         except Exception as e:
             logger.error(f"Failed to export to PDF: {e}")
             raise
 
-    def _copy_region_sheet(self, workbook, source_sheet, region: SheetRegion):
-        """Copy a worksheet and assign one verified, independent print region."""
-        last_sheet = workbook.Sheets(workbook.Sheets.Count)
-        source_sheet.Copy(None, last_sheet)
-        copied = workbook.Sheets(workbook.Sheets.Count)
+    @staticmethod
+    def _open_export_workbook(source_sheet) -> Any:
+        """
+        Copy ``source_sheet`` into a new workbook that receives every chunk copy.
+
+        Sheets copied into a blank workbook take its theme, Normal style and
+        default font. Starting from a copy of the source keeps those, so the
+        chunks print with the source colours, fonts and row/column sizes.
+        """
+        app = source_sheet.Application
+        try:
+            app.DisplayAlerts = False
+        except Exception:
+            pass
+        source_sheet.Copy()
+        try:
+            workbook = app.ActiveWorkbook
+            _ = workbook.Sheets.Count  # Validate connection
+        except Exception as e:
+            raise COMDisconnectedError(
+                f"Failed to access export workbook: {e}"
+            ) from e
+        return workbook
+
+    def _drop_blank_chunks(
+        self, sheet, chunks: List[SheetRegion]
+    ) -> List[SheetRegion]:
+        """
+        Drop row chunks with nothing to print so they are never copied.
+
+        A chunk is blank only without values, fills, borders, merged cells or
+        conditional formats. Sheets with shapes or sparklines are returned
+        unchanged: a picture can cover a band of empty cells, and sparklines
+        draw in cells that hold no value. A chunk is kept whenever a check
+        fails, and the original list is returned if every chunk would be
+        dropped.
+        """
+        try:
+            if int(sheet.Shapes.Count) or int(sheet.Cells.SparklineGroups.Count):
+                return chunks
+            count_a = sheet.Application.WorksheetFunction.CountA
+        except Exception:
+            return chunks
+        kept = []
+        for chunk in chunks:
+            try:
+                blank = self._range_is_blank(sheet.Range(
+                    sheet.Cells(chunk.first_row, chunk.first_col),
+                    sheet.Cells(chunk.last_row, chunk.last_col),
+                ), count_a)
+            except Exception:
+                blank = False
+            if not blank:
+                kept.append(chunk)
+        if kept and len(kept) < len(chunks):
+            logger.info(
+                f"Sheet '{sheet.Name}': skipped "
+                f"{len(chunks) - len(kept)} blank row chunk(s)"
+            )
+        return kept or chunks
+
+    @staticmethod
+    def _range_is_blank(cells, count_a) -> bool:
+        """Return whether a range has no values and no printable formatting."""
+        # Mixed formatting reads back as None, which also counts as not blank.
+        return (
+            int(count_a(cells)) == 0
+            and cells.Interior.ColorIndex == xlNone
+            and cells.Borders.LineStyle == xlNone
+            and cells.MergeCells is False
+            and int(cells.FormatConditions.Count) == 0
+        )
+
+    def _copy_region_sheet(
+        self, workbook, source_sheet, region: SheetRegion,
+        sheet_count: Optional[int] = None,
+    ):
+        """
+        Copy a worksheet to the end of ``workbook`` and assign one verified print region.
+
+        Callers that track the workbook's sheet count pass it as ``sheet_count``
+        to skip the ``Sheets.Count`` read.
+        """
+        sheets = workbook.Sheets
+        count = sheets.Count if sheet_count is None else sheet_count
+        source_sheet.Copy(None, sheets(count))
+        copied = sheets(count + 1)
+        self._set_region_print_area(copied, region)
+        return copied
+
+    def _set_region_print_area(self, sheet, region: SheetRegion) -> None:
+        """Point the sheet's PrintArea at one region and verify Excel kept it."""
         first_col = self._col_num_to_letter(region.first_col)
         last_col = self._col_num_to_letter(region.last_col)
         print_area = (
             f"${first_col}${region.first_row}:${last_col}${region.last_row}"
         )
-        self._required_set_page_property(copied.PageSetup, "PrintArea", print_area)
-        return copied
+        self._required_set_page_property(sheet.PageSetup, "PrintArea", print_area)
 
     def _resolve_sheet_regions(self, sheet, policy: str) -> List[SheetRegion]:
         """Resolve preserved Range.Areas or automatic cell/shape content bounds."""
@@ -2905,46 +3223,56 @@ class ExcelConverter(Converter):
 
         first_row = first_col = None
         last_row = last_col = None
-        # Search formulas as well as displayed values. Page breaks are deliberately
-        # excluded: they describe pagination, not visible content.
+        # Search formulas as well as displayed values and keep the union; an
+        # xlFormulas search misses value-only cells such as dynamic-array
+        # spills. Page breaks are deliberately excluded: they describe
+        # pagination, not visible content.
         for look_in in (-4123, -4163):  # xlFormulas, xlValues
             try:
-                first_r = sheet.Cells.Find(
-                    What="*", After=sheet.Range("A1"), LookIn=look_in, LookAt=2,
+                cells = sheet.Cells
+                after = sheet.Range("A1")
+                first_r = cells.Find(
+                    What="*", After=after, LookIn=look_in, LookAt=2,
                     SearchOrder=self.xlByRows, SearchDirection=1,
                 )
-                last_r = sheet.Cells.Find(
-                    What="*", After=sheet.Range("A1"), LookIn=look_in, LookAt=2,
+                last_r = cells.Find(
+                    What="*", After=after, LookIn=look_in, LookAt=2,
                     SearchOrder=self.xlByRows, SearchDirection=self.xlPrevious,
                 )
-                first_c = sheet.Cells.Find(
-                    What="*", After=sheet.Range("A1"), LookIn=look_in, LookAt=2,
+                first_c = cells.Find(
+                    What="*", After=after, LookIn=look_in, LookAt=2,
                     SearchOrder=self.xlByColumns, SearchDirection=1,
                 )
-                last_c = sheet.Cells.Find(
-                    What="*", After=sheet.Range("A1"), LookIn=look_in, LookAt=2,
+                last_c = cells.Find(
+                    What="*", After=after, LookIn=look_in, LookAt=2,
                     SearchOrder=self.xlByColumns, SearchDirection=self.xlPrevious,
                 )
                 if all((first_r, last_r, first_c, last_c)):
-                    first_row = min(first_row or first_r.Row, int(first_r.Row))
-                    last_row = max(last_row or last_r.Row, int(last_r.Row))
-                    first_col = min(first_col or first_c.Column, int(first_c.Column))
-                    last_col = max(last_col or last_c.Column, int(last_c.Column))
+                    top, bottom = int(first_r.Row), int(last_r.Row)
+                    left, right = int(first_c.Column), int(last_c.Column)
+                    first_row = top if first_row is None else min(first_row, top)
+                    last_row = bottom if last_row is None else max(last_row, bottom)
+                    first_col = left if first_col is None else min(first_col, left)
+                    last_col = right if last_col is None else max(last_col, right)
             except Exception:
                 continue
 
         # Include visible shapes by their anchor cells. Hidden shapes do not render.
         try:
-            for index in range(1, int(sheet.Shapes.Count) + 1):
-                shape = sheet.Shapes(index)
+            shapes = sheet.Shapes
+            for index in range(1, int(shapes.Count) + 1):
+                shape = shapes(index)
                 if hasattr(shape, "Visible") and not bool(shape.Visible):
                     continue
+                # Each anchor coordinate is read once; ``x or y`` would read it twice.
                 top_left = shape.TopLeftCell
                 bottom_right = shape.BottomRightCell
-                first_row = min(first_row or top_left.Row, int(top_left.Row))
-                first_col = min(first_col or top_left.Column, int(top_left.Column))
-                last_row = max(last_row or bottom_right.Row, int(bottom_right.Row))
-                last_col = max(last_col or bottom_right.Column, int(bottom_right.Column))
+                top, left = int(top_left.Row), int(top_left.Column)
+                bottom, right = int(bottom_right.Row), int(bottom_right.Column)
+                first_row = top if first_row is None else min(first_row, top)
+                first_col = left if first_col is None else min(first_col, left)
+                last_row = bottom if last_row is None else max(last_row, bottom)
+                last_col = right if last_col is None else max(last_col, right)
         except Exception:
             pass
         if None in (first_row, first_col, last_row, last_col):
@@ -3194,6 +3522,7 @@ class ExcelConverter(Converter):
             last_row = 1
             last_col = 1
             bounds_source = "default"
+            used_range = None
             
             # Priority 1: Check for PrintArea
             print_row, print_col = self._get_print_area_bounds(sheet)
@@ -3221,7 +3550,8 @@ class ExcelConverter(Converter):
                     if last_row_cell:
                         last_row = last_row_cell.Row
                 except Exception:
-                    last_row = sheet.UsedRange.Rows.Count
+                    used_range = sheet.UsedRange
+                    last_row = used_range.Rows.Count
                 
                 try:
                     last_col_cell = sheet.Cells.Find(
@@ -3235,7 +3565,9 @@ class ExcelConverter(Converter):
                     if last_col_cell:
                         last_col = last_col_cell.Column
                 except Exception:
-                    last_col = sheet.UsedRange.Columns.Count
+                    if used_range is None:
+                        used_range = sheet.UsedRange
+                    last_col = used_range.Columns.Count
                 
                 # Apply page break bounds if they are larger
                 if break_row > last_row:
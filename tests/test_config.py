@@ -9,11 +9,13 @@ from src.config import (
     PDFConversionSettings,
     TrimWhitespaceSettings,
     _merge_dict,
+    compute_match_paths,
     get_excel_sheet_settings,
     get_parallel_config,
     get_pdf_handling_config,
     get_pdf_settings,
     load_config,
+    load_excel_sheet_rules,
 )
 
 # Mock config data
@@ -303,3 +305,37 @@ def test_malformed_yaml_is_fatal(tmp_path):
     with pytest.raises(ValueError, match="Malformed YAML"):
         load_config(malformed)
 
+
+
+def test_compute_match_paths_relative_and_outside_base(tmp_path):
+    base = tmp_path / "input"
+    inside = base / "reports" / "q1.xlsx"
+    assert compute_match_paths(inside, base) == (
+        inside.as_posix(), "reports/q1.xlsx"
+    )
+    outside = tmp_path / "other" / "q1.xlsx"
+    assert compute_match_paths(outside, base) == (outside.as_posix(), "")
+    assert compute_match_paths(None, base) == ("", "")
+
+
+def test_excel_sheet_settings_use_precomputed_match_paths(mock_load_config):
+    with patch("src.config.compute_match_paths") as compute:
+        get_excel_sheet_settings(
+            "Sheet1", PDFConversionSettings(), Path("/data/a.xlsx"),
+            Path("/data"), match_paths=("/data/a.xlsx", "a.xlsx"),
+        )
+    compute.assert_not_called()
+
+
+def test_excel_sheet_settings_reuse_cached_merge_for_same_rules(mock_load_config):
+    rules = load_excel_sheet_rules()
+    mock_load_config.reset_mock()
+    cache = {}
+    base = PDFConversionSettings()
+    first = get_excel_sheet_settings("Sheet1", base, rules=rules, cache=cache)
+    second = get_excel_sheet_settings("Sheet2", base, rules=rules, cache=cache)
+
+    assert second is first
+    assert first.layout.orientation == "landscape"
+    assert list(cache) == [(0,)]
+    mock_load_config.assert_not_called()
@@ -1,7 +1,7 @@
 from contextlib import nullcontext
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -347,6 +347,23 @@ def test_printer_probe_cache_skips_rejected_and_accepted_reprobes():
     assert setter.call_count == 1
 
 
+def test_printer_probe_uses_caller_supplied_active_printer():
+    converter = ExcelConverter()
+    sheet, _ = _strict_sheet()
+    sheet.Application.ActivePrinter = "Other Printer on Ne01:"
+    form = PaperForm(9, "A4", 8.27, 11.69)
+
+    with patch.object(converter, "_try_set_paper_size", return_value=True):
+        converter._probe_paper_orientation(
+            sheet.PageSetup, form, 1, (36.0, 36.0, 36.0, 36.0),
+            active_printer="Microsoft Print to PDF on Ne02:",
+        )
+
+    assert [key[0] for key in converter._paper_probe_cache] == [
+        "microsoft print to pdf on ne02:"
+    ]
+
+
 def test_page_setup_does_not_count_vertical_margins_twice():
     converter = ExcelConverter()
     sheet, _ = _strict_sheet()
@@ -759,7 +776,10 @@ def test_oversized_action_warn_keeps_legacy_fit_mode():
     assert sheet.PageSetup.FitToPagesTall == 1
 
 
-def test_skip_rolls_back_previously_staged_chunks_and_page_count(tmp_path):
+@pytest.mark.parametrize("skipped_sheet_first", [True, False])
+def test_skip_rolls_back_previously_staged_chunks_and_page_count(
+    tmp_path, skipped_sheet_first
+):
     converter = ExcelConverter()
     input_path = tmp_path / "book.xlsx"
     output_path = tmp_path / "book.pdf"
@@ -793,24 +813,36 @@ def test_skip_rolls_back_previously_staged_chunks_and_page_count(tmp_path):
             print_area_policy="auto",
         )
     )
-    exported_sheets = []
+    exported_workbooks = []
 
     def resolve_regions(sheet, _policy):
         return skipped_regions if sheet is skipped_source else valid_regions
 
-    def export_pdf(_workbook, sheets, stage_path, _settings):
-        exported_sheets.extend(sheets)
+    def export_pdf(workbook, stage_path, _settings):
+        exported_workbooks.append(workbook)
         Path(stage_path).write_bytes(b"staged-pdf")
 
+    # The first chunk of each export workbook is the copy that creates it.
+    first_workbook, second_workbook = MagicMock(), MagicMock()
+    if skipped_sheet_first:
+        sources = [skipped_source, valid_source]
+        first_workbook.Sheets.return_value = skipped_first
+        second_workbook.Sheets.return_value = valid_copy
+        workbooks = [first_workbook, second_workbook]
+        copies = [skipped_second]
+        page_setups = [None, OversizedSheetError("too large"), None]
+    else:
+        sources = [valid_source, skipped_source]
+        first_workbook.Sheets.return_value = valid_copy
+        workbooks = [first_workbook]
+        copies = [skipped_first, skipped_second]
+        page_setups = [None, None, OversizedSheetError("too large")]
+
     with (
         patch.object(
             converter, "_excel_application", return_value=nullcontext(app)
         ),
-        patch.object(
-            converter,
-            "_get_sheets_to_export",
-            return_value=[skipped_source, valid_source],
-        ),
+        patch.object(converter, "_get_sheets_to_export", return_value=sources),
         patch(
             "src.core.excel_converter.get_excel_sheet_settings",
             return_value=settings,
@@ -819,15 +851,11 @@ def test_skip_rolls_back_previously_staged_chunks_and_page_count(tmp_path):
             converter, "_resolve_sheet_regions", side_effect=resolve_regions
         ),
         patch.object(
-            converter,
-            "_copy_region_sheet",
-            side_effect=[skipped_first, skipped_second, valid_copy],
-        ),
-        patch.object(
-            converter,
-            "_apply_page_setup",
-            side_effect=[None, OversizedSheetError("too large"), None],
-        ),
+            converter, "_open_export_workbook", side_effect=workbooks
+        ) as open_export,
+        patch.object(converter, "_set_region_print_area"),
+        patch.object(converter, "_copy_region_sheet", side_effect=copies),
+        patch.object(converter, "_apply_page_setup", side_effect=page_setups),
         patch.object(converter, "_export_to_pdf", side_effect=export_pdf),
         patch(
             "src.core.excel_converter.pythoncom.CoInitialize"
@@ -840,34 +868,48 @@ def test_skip_rolls_back_previously_staged_chunks_and_page_count(tmp_path):
         result = converter.convert(input_path, output_path, settings)
 
     assert result == output_path.resolve()
-    assert exported_sheets == [valid_copy]
+    # Only the workbook holding the valid chunk is printed.
+    assert exported_workbooks == workbooks[-1:]
     assert output_path.read_bytes() == b"staged-pdf"
+    assert [call.args for call in open_export.call_args_list] == [
+        (source,) for source in sources[:len(workbooks)]
+    ]
+    if skipped_sheet_first:
+        # A workbook holding only skipped chunks is closed, never printed.
+        skipped_first.Delete.assert_not_called()
+        skipped_second.Delete.assert_not_called()
+    else:
+        skipped_first.Delete.assert_called_once_with()
+        skipped_second.Delete.assert_called_once_with()
+    for export_workbook in workbooks:
+        export_workbook.Close.assert_called_once_with(SaveChanges=False)
+    app.Workbooks.Add.assert_not_called()
+    skipped_source.Delete.assert_not_called()
+
+
+def test_open_export_workbook_copies_the_source_sheet():
+    app = MagicMock()
+    source = MagicMock()
+    source.Application = app
+
+    export_workbook = ExcelConverter._open_export_workbook(source)
 
+    source.Copy.assert_called_once_with()
+    assert export_workbook is app.ActiveWorkbook
+    app.Workbooks.Add.assert_not_called()
 
-def test_multi_sheet_temp_workbook_copy_failure_is_fatal():
+
+def test_export_to_pdf_exports_the_export_workbook_once():
     converter = ExcelConverter()
     app = MagicMock()
     app.Version = "16"
-    workbook = MagicMock()
-    workbook.Application = app
-    temp_workbook = MagicMock()
-    temp_workbook.Sheets.Count = 1
-    app.ActiveWorkbook = temp_workbook
-
-    first = MagicMock(Name="First")
-    second = MagicMock(Name="Second")
-    second.Copy.side_effect = RuntimeError("copy failed")
-
-    with pytest.raises(ValueError):
-        converter._export_to_pdf(
-            workbook,
-            [first, second],
-            "out.pdf",
-            PDFConversionSettings(),
-        )
+    export_workbook = MagicMock()
+    export_workbook.Application = app
 
-    temp_workbook.ExportAsFixedFormat.assert_not_called()
-    temp_workbook.Close.assert_called_once_with(SaveChanges=False)
+    converter._export_to_pdf(export_workbook, "out.pdf", PDFConversionSettings())
+
+    export_workbook.ExportAsFixedFormat.assert_called_once()
+    assert export_workbook.ExportAsFixedFormat.call_args.kwargs["Filename"] == "out.pdf"
 
 
 def test_excel_application_uses_dispatch_ex():
@@ -876,7 +918,10 @@ def test_excel_application_uses_dispatch_ex():
     app.Version = "16"
     with patch(
         "src.core.excel_converter.win32com.client.DispatchEx", return_value=app
-    ) as dispatch, patch.object(
+    ) as dispatch, patch(
+        "src.core.excel_converter.win32com.client.gencache.EnsureDispatch",
+        side_effect=lambda instance: instance,
+    ) as ensure_dispatch, patch.object(
         converter, "_set_optimal_printer"
     ), patch(
         "src.core.excel_converter.ProcessRegistry"
@@ -884,3 +929,579 @@ def test_excel_application_uses_dispatch_ex():
         with converter._excel_application() as actual:
             assert actual is app
     dispatch.assert_called_once_with("Excel.Application")
+    ensure_dispatch.assert_called_once_with(app)
+
+
+def test_early_binding_failure_falls_back_to_late_bound_instance():
+    app = MagicMock()
+    with patch(
+        "src.core.excel_converter.win32com.client.gencache.EnsureDispatch",
+        side_effect=RuntimeError("gen_py cache is read-only"),
+    ):
+        assert ExcelConverter._early_bound(app) is app
+
+
+def test_early_binding_is_serialised_across_processes():
+    app = MagicMock()
+    events = []
+    win32event = MagicMock(WAIT_TIMEOUT=258)
+    win32event.WaitForSingleObject.return_value = 0
+    win32event.ReleaseMutex.side_effect = lambda _mutex: events.append("release")
+
+    def ensure_dispatch(instance):
+        events.append("ensure")
+        return instance
+
+    with patch("src.core.excel_converter.win32event", win32event), patch(
+        "src.core.excel_converter.win32com.client.gencache.EnsureDispatch",
+        side_effect=ensure_dispatch,
+    ) as ensure:
+        assert ExcelConverter._early_bound(app) is app
+        assert events == ["ensure", "release"]
+
+        win32event.WaitForSingleObject.return_value = 258
+        assert ExcelConverter._early_bound(app) is app
+    ensure.assert_called_once_with(app)
+
+
+def test_legacy_chunks_inherit_shared_header_from_source_sheet(tmp_path):
+    converter = ExcelConverter()
+    input_path = tmp_path / "book.xlsx"
+    output_path = tmp_path / "book.pdf"
+    input_path.touch()
+
+    app = MagicMock()
+    app.Version = "16"
+    workbook = MagicMock()
+    workbook.Application = app
+    app.Workbooks.Open.return_value = workbook
+
+    source = MagicMock(Name="Data")
+    copies = [MagicMock(Name="Data-1"), MagicMock(Name="Data-2")]
+    for copied in copies:
+        copied.Range.return_value = SimpleNamespace(Width=5 * 72, Height=5 * 72)
+    settings = PDFConversionSettings(
+        excel=ExcelSettings(
+            quality_profile="legacy",
+            row_dimensions=10,
+            metadata_header=True,
+            print_area_policy="auto",
+        )
+    )
+
+    def export_pdf(_workbook, stage_path, _settings):
+        Path(stage_path).write_bytes(b"staged-pdf")
+
+    with (
+        patch.object(
+            converter, "_excel_application", return_value=nullcontext(app)
+        ),
+        patch.object(converter, "_get_sheets_to_export", return_value=[source]),
+        patch(
+            "src.core.excel_converter.get_excel_sheet_settings",
+            return_value=settings,
+        ),
+        patch.object(
+            converter,
+            "_resolve_sheet_regions",
+            return_value=[SheetRegion(1, 1, 20, 5)],
+        ),
+        patch.object(
+            converter, "_open_export_workbook",
+            return_value=MagicMock(Sheets=MagicMock(return_value=copies[0])),
+        ),
+        patch.object(converter, "_set_region_print_area"),
+        patch.object(converter, "_copy_region_sheet", side_effect=copies[1:]),
+        patch.object(converter, "_apply_page_setup"),
+        patch.object(converter, "_export_to_pdf", side_effect=export_pdf),
+        patch("src.core.excel_converter.pythoncom"),
+        patch(
+            "pypdf.PdfReader",
+            return_value=SimpleNamespace(pages=[object(), object()]),
+        ),
+    ):
+        converter.convert(input_path, output_path, settings)
+
+    assert source.PageSetup.LeftHeader == "Data"
+    assert source.PageSetup.RightHeader == "book.xlsx (Page &P)"
+    assert [copied.PageSetup.CenterHeader for copied in copies] == [
+        "1-10", "11-20"
+    ]
+
+
+def test_font_preflight_reads_used_range_once():
+    used_range = MagicMock()
+    used_range.SpecialCells.return_value.Cells.Count = 0
+    sheet = MagicMock()
+    sheet.Shapes.Count = 0
+    used_range_property = PropertyMock(return_value=used_range)
+    type(sheet).UsedRange = used_range_property
+    with patch.object(
+        ExcelConverter, "_installed_windows_fonts", return_value=set()
+    ):
+        ExcelConverter._font_preflight(
+            MagicMock(), sheet, ExcelSettings(quality_profile="strict")
+        )
+    assert used_range_property.call_count == 1
+    assert used_range.SpecialCells.call_count == 2
+
+
+def test_quality_chunks_export_source_sheet_without_copies(tmp_path):
+    converter = ExcelConverter()
+    sheet = MagicMock(Name="Data")
+    sheet.PageSetup.Zoom = 90
+    sheet.PageSetup.HeaderMargin = 18
+    sheet.PageSetup.TopMargin = 72
+    sheet.PageSetup.LeftHeader = ""
+    sheet.PageSetup.CenterHeader = "Q1"
+    sheet.PageSetup.RightHeader = ""
+    sheet.Range.return_value = SimpleNamespace(Width=5 * 72, Height=5 * 72)
+    resolver = MagicMock()
+    resolver.resolve.return_value = SimpleNamespace(
+        regions=(SimpleNamespace(
+            order=1, first_row=1, first_col=1, last_row=20, last_col=5,
+        ),),
+        objects=(), certain=True, errors=(),
+    )
+    chunks = [
+        SimpleNamespace(first_row=1, first_col=1, last_row=10, last_col=5),
+        SimpleNamespace(first_row=11, first_col=1, last_row=20, last_col=5),
+    ]
+    selected = SimpleNamespace(
+        form=SimpleNamespace(paper_enum=9, name="A4"), orientation=1,
+        usable_width_inches=7.5, usable_height_inches=10.0,
+        width_scale=1.0, height_scale=1.0, effective_scale=1.0,
+        pages_wide=1, pages_tall=1,
+    )
+    exported = []
+
+    def export_unit(source, unit, _settings):
+        exported.append((
+            source, source.PageSetup.PrintArea, source.PageSetup.CenterHeader, unit,
+        ))
+
+    sheet_pdf = tmp_path / "sheet-0001.pdf"
+    with (
+        patch("src.core.excel_converter.SafeChunkPlanner.chunks", return_value=chunks),
+        patch.object(converter, "_apply_page_setup", return_value=selected),
+        patch.object(
+            converter,
+            "_probe_pagination",
+            return_value=SimpleNamespace(pages_wide=1, pages_tall=1),
+        ),
+        patch.object(converter, "_export_quality_unit", side_effect=export_unit),
+        patch.object(converter, "_merge_quality_units") as merge,
+    ):
+        staged, decision, _, expected = converter._stage_quality_sheet(
+            MagicMock(), sheet, 1, tmp_path / "book.xlsx",
+            ExcelSettings(
+                quality_profile="strict", row_dimensions=10,
+                metadata_header=True, metadata_header_policy="append",
+            ),
+            None, None, False, resolver, (), None,
+            sheet_pdf, PDFConversionSettings(),
+        )
+
+    assert staged == []
+    sheet.Copy.assert_not_called()
+    assert [item[1:3] for item in exported] == [
+        ("$A$1:$E$10", "Q1 | 1-10"),
+        ("$A$11:$E$20", "Q1 | 11-20"),
+    ]
+    assert all(item[0] is sheet for item in exported)
+    merge.assert_called_once_with([item[3] for item in exported], sheet_pdf)
+    assert expected == 2
+    assert decision.chosen.zoom == 90
+
+
+def test_named_sheet_is_fetched_without_scanning_worksheets():
+    converter = ExcelConverter()
+    target = MagicMock(Name="Data", Visible=-1)
+    workbook = MagicMock()
+    workbook.Worksheets.return_value = target
+    workbook.Worksheets.__iter__.side_effect = AssertionError("scanned")
+
+    with patch.object(converter, "_has_valid_page_setup", return_value=True):
+        sheets = converter._get_sheets_to_export(
+            workbook, ExcelSettings(sheet_name="Data")
+        )
+
+    assert sheets == [target]
+    workbook.Worksheets.assert_called_once_with("Data")
+    workbook.Worksheets.side_effect = RuntimeError("no such sheet")
+    with patch.object(converter, "_has_valid_page_setup", return_value=True):
+        assert converter._get_sheets_to_export(
+            workbook, ExcelSettings(sheet_name="Missing")
+        ) == []
+
+
+def test_suspend_calculation_returns_mode_to_restore():
+    app = SimpleNamespace(Calculation=-4105)
+    assert ExcelConverter._suspend_calculation(app) == -4105
+    assert app.Calculation == -4135
+    assert ExcelConverter._suspend_calculation(app) == -4135
+
+    class NoWorkbookApp:
+        @property
+        def Calculation(self):
+            raise RuntimeError("Unable to get the Calculation property")
+
+    assert ExcelConverter._suspend_calculation(NoWorkbookApp()) is None
+
+
+def test_optimal_printer_uses_devices_registry_port_first():
+    converter = ExcelConverter()
+    app = SimpleNamespace(ActivePrinter="Other Printer on Ne00:")
+    with patch(
+        "src.core.excel_converter.win32print.OpenPrinter",
+        side_effect=RuntimeError("no spooler"),
+    ), patch.object(
+        ExcelConverter, "_devices_registry_port", return_value="Ne03:"
+    ):
+        converter._set_optimal_printer(app)
+    assert app.ActivePrinter == "Microsoft Print to PDF on Ne03:"
+
+
+def test_devices_registry_port_parses_winspool_value():
+    import sys
+    from contextlib import nullcontext as key_context
+
+    winreg = SimpleNamespace(
+        HKEY_CURRENT_USER=object(),
+        OpenKey=lambda *_args: key_context(),
+        QueryValueEx=lambda _key, _name: ("winspool,Ne07:,15,45", 1),
+    )
+    with patch.dict(sys.modules, {"winreg": winreg}):
+        assert ExcelConverter._devices_registry_port("Printer") == "Ne07:"
+
+    def missing_value(_key, name):
+        raise FileNotFoundError(name)
+
+    winreg.QueryValueEx = missing_value
+    with patch.dict(sys.modules, {"winreg": winreg}):
+        assert ExcelConverter._devices_registry_port("Missing") is None
+
+
+def test_legacy_export_writes_every_chunk_in_one_call(tmp_path):
+    converter = ExcelConverter()
+    input_path = tmp_path / "book.xlsx"
+    output_path = tmp_path / "book.pdf"
+    input_path.touch()
+
+    app = MagicMock()
+    app.Version = "16"
+    sources = [MagicMock(Name=f"Sheet{index}") for index in range(3)]
+    copies = []
+
+    def copy_region(_workbook, _sheet, _region, sheet_count=None):
+        copied = MagicMock(Name=f"Copy{len(copies)}")
+        copied.Range.return_value = SimpleNamespace(Width=5 * 72, Height=5 * 72)
+        copies.append(copied)
+        return copied
+
+    export_workbook = MagicMock()
+    export_workbook.Sheets.side_effect = lambda _index: copy_region(None, None, None)
+    exports = []
+
+    def export_pdf(workbook, stage_path, _settings):
+        exports.append(workbook)
+        Path(stage_path).write_bytes(b"pdf")
+
+    settings = PDFConversionSettings(
+        excel=ExcelSettings(
+            quality_profile="legacy", row_dimensions=10,
+            metadata_header=False, print_area_policy="auto",
+        )
+    )
+    with (
+        patch.object(
+            converter, "_excel_application", return_value=nullcontext(app)
+        ),
+        patch.object(converter, "_get_sheets_to_export", return_value=sources),
+        patch(
+            "src.core.excel_converter.get_excel_sheet_settings",
+            return_value=settings,
+        ),
+        patch.object(
+            converter, "_resolve_sheet_regions",
+            return_value=[SheetRegion(1, 1, 10, 5)],
+        ),
+        patch.object(
+            converter, "_open_export_workbook", return_value=export_workbook
+        ) as open_export,
+        patch.object(converter, "_set_region_print_area"),
+        patch.object(converter, "_copy_region_sheet", side_effect=copy_region),
+        patch.object(converter, "_apply_page_setup"),
+        patch.object(converter, "_export_to_pdf", side_effect=export_pdf),
+        patch("src.core.excel_converter.pythoncom"),
+        patch(
+            "pypdf.PdfReader",
+            return_value=SimpleNamespace(pages=[object()] * 3),
+        ),
+    ):
+        converter.convert(input_path, output_path, settings)
+
+    # One export keeps &P/&N page numbering continuous across all chunks.
+    assert exports == [export_workbook]
+    assert len(copies) == len(sources)
+    open_export.assert_called_once_with(sources[0])
+    assert output_path.read_bytes() == b"pdf"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "book.pdf", "book.xlsx"
+    ]
+
+
+def test_set_page_properties_writes_in_order_without_readback():
+    writes = []
+
+    class Setup:
+        Application = object()
+
+        def __setattr__(self, name, value):
+            if name == "Zoom" and value == 5:
+                raise RuntimeError("out of range")
+            writes.append((name, value))
+
+    ExcelConverter._set_page_properties(
+        Setup(), {"PaperSize": 9, "Orientation": 2, "Zoom": 90}
+    )
+    assert writes == [("PaperSize", 9), ("Orientation", 2), ("Zoom", 90)]
+    with pytest.raises(ValueError, match="rejected required PageSetup.Zoom"):
+        ExcelConverter._set_page_properties(Setup(), {"Zoom": 5})
+
+
+def test_metadata_header_writes_are_batched_under_print_communication():
+    events = []
+
+    class App:
+        def __setattr__(self, name, value):
+            events.append((name, value))
+
+    class Setup:
+        def __setattr__(self, name, value):
+            events.append((name, value))
+
+    sheet = SimpleNamespace(Name="Data", PageSetup=Setup(), Application=App())
+    converter = ExcelConverter.__new__(ExcelConverter)
+    converter._apply_metadata_header(sheet, ExcelSettings(), "book.xlsx")
+
+    assert events[0] == ("PrintCommunication", False)
+    assert events[-1] == ("PrintCommunication", True)
+    assert ("RightHeader", "book.xlsx (Page &P)") in events
+
+
+def test_region_search_unions_formula_and_value_passes():
+    converter = ExcelConverter.__new__(ExcelConverter)
+    sheet = MagicMock()
+    sheet.Shapes.Count = 0
+    row = PropertyMock(side_effect=lambda: 9 if look_in[-1] == -4163 else 2)
+    column = PropertyMock(side_effect=lambda: 7 if look_in[-1] == -4163 else 3)
+    look_in = []
+
+    class Found:
+        Row = row
+        Column = column
+
+    def find(**kwargs):
+        # A spilled dynamic array extends only the xlValues bounds.
+        look_in.append(kwargs["LookIn"])
+        return Found()
+
+    sheet.Cells.Find.side_effect = find
+
+    assert converter._resolve_sheet_regions(sheet, "auto") == [SheetRegion(2, 3, 9, 7)]
+    assert sheet.Cells.Find.call_count == 8
+    # Each pass reads one Row or Column per Find result.
+    assert row.call_count == 4
+    assert column.call_count == 4
+
+
+def test_region_shape_anchors_are_read_once_each():
+    converter = ExcelConverter.__new__(ExcelConverter)
+    sheet = MagicMock()
+    sheet.Cells.Find.return_value = None
+    row = PropertyMock(return_value=4)
+    anchor = MagicMock()
+    type(anchor).Row = row
+    anchor.Column = 2
+    shape = SimpleNamespace(Visible=True, TopLeftCell=anchor, BottomRightCell=anchor)
+    sheet.Shapes.Count = 1
+    sheet.Shapes.return_value = shape
+
+    assert converter._resolve_sheet_regions(sheet, "auto") == [SheetRegion(4, 2, 4, 2)]
+    assert row.call_count == 2
+
+
+def test_col_num_to_letter_uses_lookup_table():
+    converter = ExcelConverter.__new__(ExcelConverter)
+    assert [converter._col_num_to_letter(n) for n in (1, 26, 27, 702, 703, 16384)] == [
+        "A", "Z", "AA", "ZZ", "AAA", "XFD",
+    ]
+    assert converter._col_num_to_letter(0) == ""
+
+
+def test_optimal_printer_tries_bare_name_before_ne_sweep():
+    attempts = []
+
+    class ComError(Exception):
+        pass
+
+    class App:
+        def __setattr__(self, name, value):
+            if name == "ActivePrinter":
+                attempts.append(value)
+                if value != "Microsoft Print to PDF on Ne01:":
+                    raise ComError("rejected")
+            object.__setattr__(self, name, value)
+
+    app = App()
+    object.__setattr__(app, "ActivePrinter", "Other Printer on Ne00:")
+    with patch(
+        "src.core.excel_converter.win32print.OpenPrinter",
+        side_effect=RuntimeError("no spooler"),
+    ), patch(
+        "src.core.excel_converter.pywintypes.com_error", ComError
+    ), patch.object(
+        ExcelConverter, "_devices_registry_port", return_value=None
+    ):
+        ExcelConverter()._set_optimal_printer(app)
+
+    assert attempts == [
+        "Microsoft Print to PDF",
+        "Microsoft Print to PDF on Ne00:",
+        "Microsoft Print to PDF on Ne01:",
+    ]
+
+
+def blank_band():
+    cells = MagicMock(MergeCells=False)
+    cells.Interior.ColorIndex = -4142
+    cells.Borders.LineStyle = -4142
+    cells.FormatConditions.Count = 0
+    return cells
+
+
+def test_blank_row_chunks_are_dropped_only_without_shapes():
+    converter = ExcelConverter.__new__(ExcelConverter)
+    chunks = [
+        SheetRegion(1, 1, 10, 3), SheetRegion(11, 1, 20, 3), SheetRegion(21, 1, 25, 3)
+    ]
+    bands = {1: blank_band(), 11: blank_band(), 21: blank_band()}
+    sheet = MagicMock()
+    sheet.Shapes.Count = 0
+    sheet.Cells.SparklineGroups.Count = 0
+    sheet.Cells.side_effect = lambda row, col: row
+    sheet.Range.side_effect = lambda first, last: bands[first]
+    sheet.Application.WorksheetFunction.CountA.side_effect = (
+        lambda cells: 4 if cells is bands[1] else 0
+    )
+
+    assert converter._drop_blank_chunks(sheet, chunks) == [chunks[0]]
+
+    # Sparklines draw in cells without values, so CountA cannot see them.
+    sheet.Cells.SparklineGroups.Count = 1
+    assert converter._drop_blank_chunks(sheet, chunks) == chunks
+
+    sheet.Cells.SparklineGroups.Count = 0
+    sheet.Shapes.Count = 1
+    assert converter._drop_blank_chunks(sheet, chunks) == chunks
+
+
+@pytest.mark.parametrize(
+    ("owner", "name", "value"),
+    [
+        ("Interior", "ColorIndex", 6),
+        ("Borders", "LineStyle", None),
+        ("FormatConditions", "Count", 1),
+        (None, "MergeCells", None),
+    ],
+)
+def test_formatted_row_chunks_without_values_are_kept(owner, name, value):
+    converter = ExcelConverter.__new__(ExcelConverter)
+    cells = blank_band()
+    setattr(getattr(cells, owner) if owner else cells, name, value)
+    sheet = MagicMock()
+    sheet.Shapes.Count = 0
+    sheet.Cells.SparklineGroups.Count = 0
+    sheet.Application.WorksheetFunction.CountA.return_value = 0
+    sheet.Range.side_effect = [blank_band(), cells]
+    chunks = [SheetRegion(1, 1, 10, 3), SheetRegion(11, 1, 20, 3)]
+
+    assert converter._drop_blank_chunks(sheet, chunks) == [chunks[1]]
+
+
+@pytest.mark.parametrize(
+    ("policy", "filtered"), [("auto", True), ("preserve", False)]
+)
+def test_blank_chunk_filter_skips_authored_print_areas(tmp_path, policy, filtered):
+    converter = ExcelConverter()
+    input_path = tmp_path / "book.xlsx"
+    input_path.touch()
+    app = MagicMock()
+    app.Version = "16"
+    chunk = MagicMock()
+    chunk.Range.return_value = SimpleNamespace(Width=5 * 72, Height=5 * 72)
+    export_workbook = MagicMock()
+    export_workbook.Sheets.return_value = chunk
+
+    def export_pdf(_workbook, stage_path, _settings):
+        Path(stage_path).write_bytes(b"pdf")
+
+    settings = PDFConversionSettings(
+        excel=ExcelSettings(
+            quality_profile="legacy", row_dimensions=10,
+            metadata_header=False, print_area_policy=policy,
+        )
+    )
+    with (
+        patch.object(
+            converter, "_excel_application", return_value=nullcontext(app)
+        ),
+        patch.object(
+            converter, "_get_sheets_to_export", return_value=[MagicMock(Name="Data")]
+        ),
+        patch(
+            "src.core.excel_converter.get_excel_sheet_settings",
+            return_value=settings,
+        ),
+        patch.object(
+            converter, "_resolve_sheet_regions",
+            return_value=[SheetRegion(1, 1, 20, 5)],
+        ),
+        patch.object(
+            converter, "_drop_blank_chunks", side_effect=lambda _sheet, chunks: chunks
+        ) as drop_blank,
+        patch.object(
+            converter, "_open_export_workbook", return_value=export_workbook
+        ),
+        patch.object(converter, "_set_region_print_area"),
+        patch.object(converter, "_copy_region_sheet", return_value=chunk),
+        patch.object(converter, "_apply_page_setup"),
+        patch.object(converter, "_export_to_pdf", side_effect=export_pdf),
+        patch("src.core.excel_converter.pythoncom"),
+        patch(
+            "pypdf.PdfReader",
+            return_value=SimpleNamespace(pages=[object()] * 2),
+        ),
+    ):
+        converter.convert(input_path, tmp_path / "book.pdf", settings)
+
+    assert drop_blank.called is filtered
+
+
+def test_copy_region_sheet_uses_tracked_sheet_count():
+    converter = ExcelConverter.__new__(ExcelConverter)
+    workbook = MagicMock()
+    count = PropertyMock(return_value=99)
+    type(workbook.Sheets).Count = count
+    source = MagicMock()
+
+    with patch.object(converter, "_set_region_print_area") as set_area:
+        copied = converter._copy_region_sheet(
+            workbook, source, SheetRegion(1, 1, 5, 2), sheet_count=3
+        )
+
+    count.assert_not_called()
+    source.Copy.assert_called_once_with(None, workbook.Sheets.return_value)
+    assert [call.args for call in workbook.Sheets.call_args_list] == [(3,), (4,)]
+    set_area.assert_called_once_with(copied, SheetRegion(1, 1, 5, 2))